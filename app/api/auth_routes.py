@@ -70,7 +70,8 @@ async def send_verification_code(
                 detail="Email already registered"
             )
 
-        # Check rate limit
+        # Check rate limit - no await until store_code has recorded the send, so concurrent
+        # requests for the same email can't all pass this check
         can_send, error_msg = verification_service.can_send_code(user_data.email)
         if not can_send:
             raise HTTPException(
@@ -89,7 +90,7 @@ async def send_verification_code(
             "brokerage": user_data.brokerage,
             "password": user_data.password  # Will be hashed by verification_service
         }
-        verification_service.store_code(user_data.email, code, form_data)
+        await verification_service.store_code(user_data.email, code, form_data)
 
         # Log code in development mode (emails are auto-masked by logging filter)
         if os.getenv("MAILGUN_DEV", "yes") == "yes":
@@ -191,7 +192,7 @@ async def resend_verification_code(
 
     # Get form data to retrieve first name
     entry = verification_service._cache.get(email)
-    first_name = entry['form_data'].get('first_name', 'User') if entry else 'User'
+    first_name = entry.form_data.get('first_name', 'User') if entry else 'User'
 
     # Print code to console in development mode
     if os.getenv("MAILGUN_DEV", "yes") == "yes":
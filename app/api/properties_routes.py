@@ -3,15 +3,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
+import asyncio
 import os
 
-from app.database import get_db
+from app.database import get_db, AsyncSessionLocal
 from app.models.database import Property
 from app.services.zillow_working_service import ZillowWorkingService
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from typing import Any, Dict
 from app.models.property import PropertyDetailResponse, PropertySaveResponse, PropertyLookupRequest
+from app.utils.clean_cache import CACHE_FRESH_HOURS
 from app.config.logging import get_logger
 
 router = APIRouter()
@@ -28,6 +30,74 @@ def _convert_datetimes_to_strings(obj: Any) -> Any:
     else:
         return obj
 
+# Background cache refreshes in flight, keyed by property id (keeps tasks referenced and avoids duplicate refreshes)
+_cache_refresh_tasks: Dict[str, asyncio.Task] = {}
+
+async def _fetch_property_details(property_record: Property) -> Dict[str, Any]:
+    """Fetch detailed property information from Zillow as a JSON-serializable dict"""
+    zillow_service = ZillowWorkingService()
+
+    # Construct full address for search to avoid ambiguity
+    search_address = property_record.street_address
+    if property_record.city:
+        search_address += f", {property_record.city}"
+
+    if property_record.state:
+        search_address += f", {property_record.state}"
+
+    if property_record.zipcode:
+        search_address += f" {property_record.zipcode}"
+
+    details = await zillow_service.get_property_by_address(search_address, True)
+
+    if not details:
+        raise HTTPException(status_code=404, detail="Property details not found on Zillow")
+
+    # Convert Pydantic model to dict
+    try:
+        if hasattr(details, 'model_dump'):
+            return details.model_dump(mode='json')
+        details_dict = details.dict()
+        return _convert_datetimes_to_strings(details_dict)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Failed to process property details")
+
+async def _refresh_property_cache(property_id: str):
+    """Re-fetch and store detailed property data outside of the request (stale-while-revalidate)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            property_record = await db.get(Property, property_id)
+            if not property_record or not property_record.street_address:
+                return
+
+            details_dict = await _fetch_property_details(property_record)
+
+            property_record.detailed_property = details_dict
+            property_record.detailed_data_cached = True
+            property_record.detailed_data_cached_at = datetime.now(timezone.utc)
+            property_record.updated_at = datetime.now(timezone.utc)
+            await db.commit()
+
+            logger.info(
+                "Property cache revalidated in background",
+                extra={"event": "property_cache_revalidated", "property_id": property_id}
+            )
+    except Exception as e:
+        logger.error(
+            "Background property cache refresh failed",
+            exc_info=True,
+            extra={"property_id": property_id, "error": str(e)}
+        )
+
+def _schedule_cache_refresh(property_id: str):
+    """Start a background cache refresh for a property unless one is already running"""
+    if property_id in _cache_refresh_tasks:
+        return
+
+    task = asyncio.create_task(_refresh_property_cache(property_id))
+    _cache_refresh_tasks[property_id] = task
+    task.add_done_callback(lambda _: _cache_refresh_tasks.pop(property_id, None))
+
 class PropertyStoreRequest(BaseModel):
     property_id: str
     property_data: Dict[str, Any]
@@ -193,16 +263,22 @@ async def cache_property_details(
             raise HTTPException(status_code=404, detail="Property not found")
 
         # Check if cache is still valid (based on CACHE_EXPIRY_DAYS environment variable)
+        # Stale-while-revalidate: cached data older than CACHE_FRESH_HOURS is still served
+        # until it expires, but a background refresh is kicked off
         if property_record.detailed_data_cached and property_record.detailed_data_cached_at:
-            from datetime import timedelta
             cache_expiry_days = int(os.getenv("CACHE_EXPIRY_DAYS", 3))
+            now = datetime.now(timezone.utc)
             expiry_time = property_record.detailed_data_cached_at + timedelta(days=cache_expiry_days)
 
-            if datetime.now(timezone.utc) < expiry_time and property_record.detailed_property:
+            if now < expiry_time and property_record.detailed_property:
                 # Validate that cached data is not None/empty before returning
                 try:
                     cached_data = property_record.detailed_property
                     if cached_data and isinstance(cached_data, dict) and len(cached_data) > 0:
+                        is_stale = now - property_record.detailed_data_cached_at >= timedelta(hours=CACHE_FRESH_HOURS)
+                        if is_stale:
+                            _schedule_cache_refresh(property_id)
+
                         return {
                             "success": True,
                             "message": "Property details already cached and still valid",
@@ -210,6 +286,7 @@ async def cache_property_details(
                             "expires_at": expiry_time.isoformat(),
                             "property_id": property_id,
                             "from_cache": True,
+                            "stale": is_stale,
                             "details": cached_data
                         }
                 except Exception:
@@ -219,33 +296,7 @@ async def cache_property_details(
             raise HTTPException(status_code=400, detail="Property missing address for Zillow lookup")
 
         # Fetch from Zillow
-        zillow_service = ZillowWorkingService()
-
-        # Construct full address for search to avoid ambiguity
-        search_address = property_record.street_address
-        if property_record.city:
-            search_address += f", {property_record.city}"
-        
-        if property_record.state:
-            search_address += f", {property_record.state}"
-
-        if property_record.zipcode:
-            search_address += f" {property_record.zipcode}"
-
-        details = await zillow_service.get_property_by_address(search_address, True)
-
-        if not details:
-            raise HTTPException(status_code=404, detail="Property details not found on Zillow")
-
-        # Convert Pydantic model to dict
-        try:
-            if hasattr(details, 'model_dump'):
-                details_dict = details.model_dump(mode='json')
-            else:
-                details_dict = details.dict()
-                details_dict = _convert_datetimes_to_strings(details_dict)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail="Failed to process property details")
+        details_dict = await _fetch_property_details(property_record)
 
         # Update property with cached details
         try:
@@ -2,6 +2,7 @@ import os
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import TypeDecorator, DateTime
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from datetime import datetime, timezone
 from dotenv import load_dotenv
 
@@ -10,6 +11,11 @@ load_dotenv()
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./collections.db")
 
+# Connection pool sizing - keep pool_size >= the property sync concurrency so parallel
+# collection syncs don't serialize waiting for a connection
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+
 
 class TZDateTime(TypeDecorator):
     """
@@ -42,7 +48,12 @@ class TZDateTime(TypeDecorator):
 engine = create_async_engine(
     DATABASE_URL,
     echo=True if os.getenv("DEBUG") == "true" else False,
-    future=True
+    future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=300
 )
 
 # Create sessionmaker
@@ -14,8 +14,11 @@ from app.utils.clean_cache import cleanup_expired_property_cache
 from app.utils.property_sync_scheduler import scheduled_property_sync
 from app.services.paypal_service import PayPalService
 from app.services.email_scheduler_service import EmailSchedulerService
+from app.services.email_service import get_email_service, flush_emails
+from app.services.zillow_working_service import close_zillow_client
 from app.utils.create_admin import create_admin_user
 from app.config.logging import configure_logging, get_logger, set_request_id, clear_request_id
+from app.database import engine, DB_POOL_SIZE, DB_MAX_OVERFLOW
 
 load_dotenv()
 
@@ -62,6 +65,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"An unexpected error occurred during migration: {e}")
 
+    logger.info(
+        "Database connection pool configured",
+        extra={
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_status": engine.pool.status()
+        }
+    )
+
     # Create admin user if it doesn't exist
     await create_admin_user()
 
@@ -114,6 +126,9 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down application")
     scheduler.shutdown()
     logger.info("APScheduler stopped")
+    await flush_emails()
+    await get_email_service().aclose()
+    await close_zillow_client()
 
 app = FastAPI(title="Open House Pal API", lifespan=lifespan)
 
@@ -198,7 +213,7 @@ app.include_router(router)
 
 @app.get("/health")
 async def health():
-    return {"status": "ok"}
+    return {"status": "ok", "db_pool": engine.pool.status()}
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8080)
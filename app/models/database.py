@@ -10,7 +10,7 @@ collection_properties = Table(
     'collection_properties',
     Base.metadata,
     Column('collection_id', String, ForeignKey('collections.id'), primary_key=True),
-    Column('property_id', String, ForeignKey('properties.id'), primary_key=True),
+    Column('property_id', String, ForeignKey('properties.id'), primary_key=True, index=True),  # PK only covers collection_id-first lookups
     Column('added_at', TZDateTime(timezone=True), nullable=True)  # NULL = initial property (no NEW badge)
 )
 
@@ -248,6 +248,13 @@ class PropertyTour(Base):
     collection = relationship("Collection", back_populates="property_tours")
     property = relationship("Property")
 
+    __table_args__ = (
+        # One tour request per property in a collection (also the ON CONFLICT target when creating tours)
+        Index('ix_property_tours_collection_id_property_id', 'collection_id', 'property_id', unique=True),
+        # Serves the newest-first tour list of a collection without a sort
+        Index('ix_property_tours_collection_id_created_at', 'collection_id', 'created_at'),
+    )
+
 
 class CollectionPreferences(Base):
     __tablename__ = "collection_preferences"
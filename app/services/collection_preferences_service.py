@@ -150,7 +150,7 @@ class CollectionPreferencesService:
         Atomically update preferences and refresh properties.
         Only commits if Zillow API succeeds. If Zillow fails, rolls back everything.
         """
-        from app.services.property_sync_service import PropertySyncService
+        from app.services.property_sync_service import get_property_sync_service
         from app.config.logging import get_logger
 
         logger = get_logger(__name__)
@@ -174,7 +174,7 @@ class CollectionPreferencesService:
 
             # Now attempt to refresh properties with the updated preferences
             # This will fetch from Zillow and prepare properties (but NOT commit)
-            sync_service = PropertySyncService()
+            sync_service = get_property_sync_service()
             result = await sync_service.replace_collection_properties(db, collection_id)
 
             if not result['success']:
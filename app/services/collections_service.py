@@ -12,7 +12,7 @@ from app.models.database import Collection, Property, User, PropertyInteraction,
 from app.schemas.collection import CollectionCreate
 from app.config.logging import get_logger
 
-from app.services.property_sync_service import PropertySyncService
+from app.services.property_sync_service import get_property_sync_service
 from app.services.collection_preferences_service import CollectionPreferencesService
 
 logger = get_logger(__name__)
@@ -319,7 +319,7 @@ class CollectionsService:
                 preferences = await CollectionPreferencesService.get_preferences_by_collection_id(db, collection.id)
 
                 if preferences:
-                    sync_service = PropertySyncService()
+                    sync_service = get_property_sync_service()
                     result = await sync_service.populate_new_collection(db, collection.id)
 
             except Exception as e:
@@ -1,6 +1,8 @@
 import os
+import asyncio
 import httpx
 import json
+from functools import lru_cache
 from typing import Tuple, Optional, Dict, Any
 from dotenv import load_dotenv
 from app.config.logging import get_logger
@@ -15,6 +17,28 @@ class EmailService:
         self.mailgun_api_key = os.getenv('MAILGUN_API_KEY')
         self.mailgun_from = os.getenv("MAILGUN_FROM")
         self.is_dev = os.getenv("MAILGUN_DEV", "yes") == "yes"
+        # Created on first async send and reused so Mailgun connections are pooled
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+    def _build_request(
+        self,
+        to_email: str,
+        subject: str,
+        template: str,
+        template_variables: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """URL, auth and form payload of a Mailgun template message"""
+        return {
+            "url": self.mailgun_url,
+            "auth": ("api", self.mailgun_api_key),
+            "data": {
+                "from": f"OpenHousePal <{self.mailgun_from}>",
+                "to": to_email,
+                "subject": subject,
+                "template": template,
+                "h:X-Mailgun-Variables": json.dumps(template_variables)
+            }
+        }
 
     def send_simple_message(
         self,
@@ -38,18 +62,75 @@ class EmailService:
 
         try:
             response = httpx.post(
-                self.mailgun_url,
-                auth=("api", self.mailgun_api_key),
-                data={
-                    "from": f"OpenHousePal <{self.mailgun_from}>",
-                    "to": to_email,
-                    "subject": subject,
-                    "template": template,
-                    "h:X-Mailgun-Variables": json.dumps(template_variables)
-                },
+                **self._build_request(to_email, subject, template, template_variables),
                 timeout=10.0
             )
             return response.status_code, response.text
         except Exception as e:
             logger.error("Error sending email", exc_info=True, extra={"template": template})
             return 500, str(e)
+
+    async def send_simple_message_async(
+        self,
+        to_email: str,
+        subject: str,
+        template: str,
+        template_variables: Dict[str, Any]
+    ) -> Tuple[int, str]:
+        """Same as send_simple_message, without blocking the event loop"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=5)
+            )
+
+        try:
+            response = await self._async_client.post(
+                **self._build_request(to_email, subject, template, template_variables)
+            )
+            return response.status_code, response.text
+        except Exception as e:
+            logger.error("Error sending email", exc_info=True, extra={"template": template})
+            return 500, str(e)
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+
+@lru_cache(maxsize=1)
+def get_email_service() -> EmailService:
+    """Shared EmailService instance (configuration is read once)"""
+    return EmailService()
+
+
+# Emails still being sent in the background (kept referenced so they aren't garbage collected)
+_email_tasks: set = set()
+
+
+async def _send_email(**kwargs) -> None:
+    """Send an email and log the outcome"""
+    try:
+        status_code, response_text = await get_email_service().send_simple_message_async(**kwargs)
+        if status_code >= 400:
+            logger.error(
+                f"Background email failed: {status_code}",
+                extra={"template": kwargs.get("template"), "status_code": status_code, "response": response_text}
+            )
+    except Exception as e:
+        logger.error("Background email failed", exc_info=True, extra={"error": str(e)})
+
+
+def schedule_email(**kwargs) -> None:
+    """Send an email in the background so the caller does not wait on the mail provider"""
+    task = asyncio.create_task(_send_email(**kwargs))
+    _email_tasks.add(task)
+    task.add_done_callback(_email_tasks.discard)
+
+
+async def flush_emails() -> None:
+    """Wait for all background emails to finish sending"""
+    if _email_tasks:
+        await asyncio.gather(*_email_tasks, return_exceptions=True)
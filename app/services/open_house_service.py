@@ -3,12 +3,11 @@ from sqlalchemy import select
 from datetime import datetime
 from typing import Optional, Dict, Any
 
-from app.models.database import Property, OpenHouseVisitor, Collection, collection_properties, OpenHouseEvent, User
+from app.models.database import OpenHouseVisitor, Collection, OpenHouseEvent, User
 from app.schemas.open_house import OpenHouseFormSubmission
 from app.services.collection_preferences_service import CollectionPreferencesService
 from app.services.collections_service import CollectionsService
-from app.services.zillow_working_service import ZillowWorkingService
-from app.schemas.collection_preferences import CollectionPreferences as CollectionPreferencesSchema
+from app.services.property_sync_service import get_property_sync_service
 from app.config.logging import get_logger
 
 logger = get_logger(__name__)
@@ -96,7 +95,7 @@ class OpenHouseService:
                     
                     # Immediately fetch and populate properties using ZillowService
                     properties_added = await OpenHouseService._populate_collection_with_zillow_properties(
-                        db, collection, preferences
+                        db, collection
                     )
                     return {"success": True, "properties_added": properties_added, "collection_id": collection.id, "share_token": collection.share_token}
                 else:
@@ -114,135 +113,19 @@ class OpenHouseService:
     @staticmethod
     async def _populate_collection_with_zillow_properties(
         db: AsyncSession,
-        collection: Collection,
-        preferences: CollectionPreferencesSchema
+        collection: Collection
     ) -> int:
         """Populate collection with properties from Zillow API"""
-        try:
-            zillow_service = ZillowWorkingService()
-            
-            # Get matching properties from Zillow
-            matching_properties = await zillow_service.get_matching_properties(preferences)
-            
-            properties_added = 0
-            
-            for property_data in matching_properties:
-                zpid = property_data.get('zpid')
-                if not zpid:
-                    continue
-                
-                if await OpenHouseService._property_exists_in_collection(db, collection.id, zpid):
-                    continue
+        # Same path as agent-created collections: one bulk upsert whose RETURNING ids feed
+        # a single link insert, committed once
+        result = await get_property_sync_service().populate_new_collection(db, collection.id)
 
-                property_obj = await OpenHouseService._create_property_from_zillow_data(db, property_data)
-                await OpenHouseService._add_property_to_collection(db, collection.id, property_obj.id)
-                properties_added += 1
-            
-            return properties_added
-            
-        except Exception as e:
-            logger.error("populating collection {collection.id} with Zillow properties failed", extra={"error": str(e)})
+        if not result.get('success'):
+            logger.error(f"populating collection {collection.id} with Zillow properties failed", extra={"error": result.get('error')})
+            await db.rollback()
             return 0
-    
-    @staticmethod
-    async def _property_exists_in_collection(db: AsyncSession, collection_id: str, zpid: str) -> bool:
-        """Check if a property (by zpid) already exists in a collection"""
-        result = await db.execute(
-            select(Property.id)
-            .join(collection_properties)
-            .where(
-                collection_properties.c.collection_id == collection_id,
-                Property.zpid == zpid
-            )
-        )
-        return result.scalar_one_or_none() is not None
-    
-    @staticmethod
-    async def _create_property_from_zillow_data(db: AsyncSession, property_data: Dict[str, Any]) -> Property:
-        """Create a new Property record from Zillow data"""
-        # Check if property already exists by zpid
-        result = await db.execute(
-            select(Property).where(Property.zpid == property_data.get('zpid'))
-        )
-        existing_property = result.scalar_one_or_none()
-        
-        if existing_property:
-            # Update existing property with latest data - map field names correctly
-            field_mapping = {
-                'address': 'street_address',
-                'image_url': 'img_src',
-                'days_on_market': 'days_on_zillow',
-                'last_updated': 'last_synced'
-            }
-            
-            # Special handling for zpid (string to int conversion)
-            zpid_value = property_data.get('zpid')
-            if zpid_value and str(zpid_value).isdigit():
-                existing_property.zpid = int(zpid_value)
-            
-            for key, value in property_data.items():
-                if value is not None:
-                    # Map field name if necessary
-                    actual_field = field_mapping.get(key, key)
-                    if hasattr(existing_property, actual_field):
-                        setattr(existing_property, actual_field, value)
-            
-            # Update sync timestamp (zillow_data field was removed)
-            existing_property.last_synced = datetime.now()
-            
-            await db.commit()
-            await db.refresh(existing_property)
-            return existing_property
-        
-        # Create new property - map Zillow data fields to Property model fields
-        zpid_value = property_data.get('zpid')
-        zpid_int = int(zpid_value) if zpid_value and str(zpid_value).isdigit() else None
-        
-        property_obj = Property(
-            zpid=zpid_int,
-            street_address=property_data.get('address'),  # ✅ Fixed: address -> street_address
-            city=property_data.get('city'),
-            state=property_data.get('state'),
-            zipcode=property_data.get('zipcode'),
-            price=property_data.get('price'),
-            bedrooms=property_data.get('bedrooms'),
-            bathrooms=property_data.get('bathrooms'),
-            living_area=property_data.get('living_area'),
-            lot_size=property_data.get('lot_size'),
-            home_type=property_data.get('home_type'),
-            home_status=property_data.get('home_status'),
-            latitude=property_data.get('latitude'),
-            longitude=property_data.get('longitude'),
-            img_src=property_data.get('image_url'),
-            zestimate=property_data.get('zestimate'),
-        )
-        
-        db.add(property_obj)
-        await db.commit()
-        await db.refresh(property_obj)
-        return property_obj
-    
-    @staticmethod 
-    async def _add_property_to_collection(db: AsyncSession, collection_id: str, property_id: str):
-        """Add a property to a collection (many-to-many relationship)"""
-        # Check if relationship already exists
-        result = await db.execute(
-            select(collection_properties)
-            .where(
-                collection_properties.c.collection_id == collection_id,
-                collection_properties.c.property_id == property_id
-            )
-        )
-        
-        if result.fetchone() is None:
-            # Insert new relationship
-            await db.execute(
-                collection_properties.insert().values(
-                    collection_id=collection_id,
-                    property_id=property_id
-                )
-            )
-            await db.commit()
+
+        return result.get('new_properties_added', 0)
     
     @staticmethod
     async def get_open_house_event_by_id(db: AsyncSession, open_house_event_id: str) -> Optional[dict]:
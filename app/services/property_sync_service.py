@@ -1,26 +1,241 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-from typing import List, Dict, Any
+from sqlalchemy import select, update, and_, bindparam
+from sqlalchemy.orm import selectinload, load_only, raiseload
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import List, Dict, Any, AsyncIterator
 import asyncio
-from datetime import datetime, timezone
+import hashlib
+from contextlib import asynccontextmanager
+import json
+import time
+from functools import lru_cache
+from datetime import datetime, timezone, timedelta
 
 from app.models.database import Collection, CollectionPreferences, Property, collection_properties, User
 from app.services.zillow_working_service import ZillowWorkingService
-from app.services.collection_preferences_service import CollectionPreferencesService
-from app.services.email_service import EmailService
+from app.services.email_service import schedule_email, flush_emails
+from app.utils.clean_cache import CACHE_FRESH_HOURS
+from app.utils.query_counter import count_queries
 from app.config.logging import get_logger
 import os
+from dataclasses import dataclass
 from sqlalchemy import func
 
 # Get logger from centralized config
 logger = get_logger(__name__)
 
+# Property fields whose change makes the cached detailed Zillow data stale
+CACHE_INVALIDATING_FIELDS = ('price', 'home_status', 'zestimate')
+
+# Maximum number of collections synced concurrently (keep <= DB_POOL_SIZE)
+SYNC_CONCURRENCY = int(os.getenv('SYNC_CONCURRENCY', 5))
+
+# Base URL for showcase links in notification emails
+FRONTEND_URL = os.getenv('FRONTEND_URL', os.getenv('CLIENT_URL', 'http://localhost:3000'))
+
+# Maximum ids bound into a single IN (...) clause - larger lists are split across statements
+# to stay under SQLite's bound parameter limit and keep statement text small
+IN_CLAUSE_BATCH_SIZE = int(os.getenv('IN_CLAUSE_BATCH_SIZE', 500))
+
+def _batched(items: List[Any], size: int = IN_CLAUSE_BATCH_SIZE):
+    """Yield successive slices of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _coerce_zpid(value: Any):
+    """Return a zpid as int, or None if it isn't a valid numeric id"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+def _normalize_zpids(property_dicts: List[Dict[str, Any]]) -> List[int]:
+    """Coerce each Zillow result's zpid to int in place, returning the valid zpids"""
+    zpids = []
+    for property_data in property_dicts:
+        zpid = _coerce_zpid(property_data.get('zpid'))
+        property_data['zpid'] = zpid
+        if zpid is not None:
+            zpids.append(zpid)
+    return zpids
+
+# Parsed Zillow field -> Property column, with an optional conversion
+ZILLOW_FIELD_MAP = (
+    ('zpid', 'zpid', _coerce_zpid),
+    ('address', 'street_address', None),
+    ('city', 'city', None),
+    ('state', 'state', None),
+    ('zipcode', 'zipcode', None),
+    ('price', 'price', None),
+    ('zestimate', 'zestimate', None),
+    ('bedrooms', 'bedrooms', None),
+    ('bathrooms', 'bathrooms', None),
+    ('living_area', 'living_area', None),
+    ('lot_size', 'lot_size', None),
+    ('home_type', 'home_type', None),
+    ('home_status', 'home_status', None),
+    ('latitude', 'latitude', None),
+    ('longitude', 'longitude', None),
+    ('image_url', 'img_src', None),
+)
+
+# Property columns refreshed from Zillow data when an existing property (matched on zpid) is upserted
+PROPERTY_UPSERT_COLUMNS = tuple(column for _, column, _ in ZILLOW_FIELD_MAP if column != 'zpid')
+
+# Preference fields that determine the Zillow search - collections with identical values get identical results
+ZILLOW_SEARCH_FIELDS = (
+    'min_beds', 'max_beds', 'min_baths', 'min_price', 'max_price', 'min_year_built', 'max_year_built',
+    'lat', 'long', 'diameter', 'cities', 'townships', 'special_features',
+    'is_town_house', 'is_lot_land', 'is_condo', 'is_multi_family', 'is_single_family', 'is_apartment'
+)
+
+# How long Zillow results are reused for other collections with the same search preferences
+ZILLOW_RESULT_CACHE_TTL_SECONDS = int(os.getenv('ZILLOW_RESULT_CACHE_TTL_SECONDS', 600))
+
+def _preferences_fingerprint(preferences: CollectionPreferences) -> str:
+    """Stable hash of the preference fields that drive the Zillow search"""
+    search_values = {field: getattr(preferences, field) for field in ZILLOW_SEARCH_FIELDS}
+    encoded = json.dumps(search_values, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+@dataclass(slots=True)
+class _SharedFetch:
+    """Zillow fetch shared by every sync with the same search preferences"""
+    fetched_at: float
+    task: asyncio.Task
+    waiters: int
+
+
+def _fetch_failed(task: asyncio.Task) -> bool:
+    """True once a shared Zillow fetch has been cancelled or raised"""
+    return task.done() and (task.cancelled() or task.exception() is not None)
+
+# In debug mode any lazy load during a sync raises instead of silently issuing extra (N+1) queries
+SYNC_RAISE_ON_LAZY_LOAD = os.getenv("DEBUG") == "true"
+
+# Statements a single sync/replace may issue before it is flagged as an N+1 regression
+# (checked in DEBUG only). Bulk writes keep this independent of the number of properties
+SYNC_QUERY_BUDGET = int(os.getenv("SYNC_QUERY_BUDGET", 15))
+
+# Only the columns the sync and digest email read are loaded for collections, owners and preferences
+SYNC_LOAD_OPTIONS = (
+    load_only(
+        Collection.id, Collection.name, Collection.status, Collection.owner_id, Collection.share_token,
+        Collection.visitor_email, Collection.visitor_name, Collection.last_synced_at,
+        raiseload=SYNC_RAISE_ON_LAZY_LOAD
+    ),
+    selectinload(Collection.owner).load_only(
+        User.id, User.first_name, User.last_name, User.email,
+        raiseload=SYNC_RAISE_ON_LAZY_LOAD
+    ),
+    load_only(
+        CollectionPreferences.id, CollectionPreferences.collection_id,
+        *(getattr(CollectionPreferences, field) for field in ZILLOW_SEARCH_FIELDS),
+        raiseload=SYNC_RAISE_ON_LAZY_LOAD
+    ),
+    *((raiseload('*'),) if SYNC_RAISE_ON_LAZY_LOAD else ()),
+)
+
+# Hot lookup statements built once with bound parameters, reused on every call
+_COLLECTION_WITH_PREFERENCES_STMT = (
+    select(Collection, CollectionPreferences)
+    .outerjoin(CollectionPreferences)
+    .options(*SYNC_LOAD_OPTIONS)
+    .where(Collection.id == bindparam('collection_id'))
+)
+
+_ZPIDS_IN_COLLECTION_STMT = (
+    select(Property.zpid)
+    .join(collection_properties)
+    .where(
+        collection_properties.c.collection_id == bindparam('collection_id'),
+        Property.zpid.in_(bindparam('zpids', expanding=True))
+    )
+)
+
+_PROPERTIES_BY_ZPID_STMT = (
+    select(Property, collection_properties.c.collection_id)
+    .outerjoin(
+        collection_properties,
+        and_(
+            collection_properties.c.property_id == Property.id,
+            collection_properties.c.collection_id == bindparam('collection_id')
+        )
+    )
+    .where(Property.zpid.in_(bindparam('zpids', expanding=True)))
+)
+
+def _build_property_upsert_stmt():
+    """INSERT ... ON CONFLICT (zpid) DO UPDATE for Property rows, returning (id, zpid)"""
+    properties_table = Property.__table__
+    stmt = sqlite_insert(properties_table)
+
+    update_columns = {
+        column: func.coalesce(stmt.excluded[column], properties_table.c[column])
+        for column in PROPERTY_UPSERT_COLUMNS
+    }
+    update_columns['updated_at'] = func.now()
+
+    return stmt.on_conflict_do_update(
+        index_elements=['zpid'],
+        set_=update_columns
+    ).returning(properties_table.c.id, properties_table.c.zpid)
+
+_PROPERTY_UPSERT_STMT = _build_property_upsert_stmt()
+
+_COLLECTION_PROPERTY_INSERT_STMT = sqlite_insert(collection_properties).on_conflict_do_nothing(
+    index_elements=['collection_id', 'property_id']
+)
+
 class PropertySyncService:
     def __init__(self):
         self.zillow_service = ZillowWorkingService()
-        self.email_service = EmailService()
-    
+        # Zillow results per preferences fingerprint (task resolves to the result pages).
+        # Concurrent syncs with identical search preferences share one Zillow call
+        self._zillow_results: Dict[str, _SharedFetch] = {}
+
+    async def _await_shared_fetch(self, shared: _SharedFetch) -> list:
+        """
+        Wait for a shared Zillow fetch without letting its cancellation reach this caller
+        """
+        try:
+            return await asyncio.shield(shared.task)
+        except asyncio.CancelledError:
+            # Only our own cancellation propagates - a cancelled fetch is an ordinary failure
+            if shared.task.cancelled() and not asyncio.current_task().cancelling():
+                raise RuntimeError("Shared Zillow fetch was cancelled") from None
+            raise
+
+    async def _release_shared_fetch(self, shared: _SharedFetch) -> None:
+        """
+        Drop one waiter from a shared Zillow fetch, cancelling it once nobody is waiting on it
+        """
+        shared.waiters -= 1
+        if shared.waiters == 0 and not shared.task.done():
+            shared.task.cancel()
+            await asyncio.wait([shared.task])
+        if shared.task.done() and not shared.task.cancelled():
+            shared.task.exception()  # mark a fetch error as retrieved
+
+    @asynccontextmanager
+    async def _query_budget(self, db: AsyncSession, operation: str) -> AsyncIterator[None]:
+        """
+        In DEBUG, count the statements issued inside the block and warn when they exceed SYNC_QUERY_BUDGET
+        """
+        if not SYNC_RAISE_ON_LAZY_LOAD:
+            yield
+            return
+
+        async with count_queries(db) as statements:
+            yield
+
+        if len(statements) > SYNC_QUERY_BUDGET:
+            logger.warning(
+                f"{operation} issued {len(statements)} queries (budget {SYNC_QUERY_BUDGET})",
+                extra={"operation": operation, "query_count": len(statements), "query_budget": SYNC_QUERY_BUDGET}
+            )
+
     async def get_total_active_collections_count(self, db: AsyncSession) -> int:
         """
         Get total count of active collections that have preferences
@@ -42,6 +257,7 @@ class PropertySyncService:
         """
         Get active collections that have preferences set, ordered by last_synced_at (oldest first)
         Eagerly loads the owner relationship for email notifications
+        Only the columns used by the sync are loaded (see SYNC_LOAD_OPTIONS)
 
         Args:
             db: Database session
@@ -53,7 +269,7 @@ class PropertySyncService:
         query = (
             select(Collection, CollectionPreferences)
             .join(CollectionPreferences)
-            .options(selectinload(Collection.owner))
+            .options(*SYNC_LOAD_OPTIONS)
             .where(Collection.status == 'ACTIVE')
             .order_by(Collection.last_synced_at.asc().nullsfirst())  # NULL = never synced (highest priority)
         )
@@ -64,189 +280,271 @@ class PropertySyncService:
         result = await db.execute(query)
         return result.fetchall()
     
-    async def property_exists_in_collection(
-        self, 
-        db: AsyncSession, 
-        collection_id: str, 
-        zpid: str
-    ) -> bool:
+    async def stream_active_collection_ids(self, db: AsyncSession) -> AsyncIterator[str]:
         """
-        Check if a property (by zpid) already exists in a collection
+        Stream ids of active collections that have preferences set, ordered by last_synced_at (oldest first)
+        Rows are fetched in batches rather than loading every collection into memory
         """
-        result = await db.execute(
-            select(Property.id)
-            .join(collection_properties)
-            .where(
-                collection_properties.c.collection_id == collection_id,
-                Property.zpid == zpid
-            )
+        result = await db.stream_scalars(
+            select(Collection.id)
+            .join(CollectionPreferences)
+            .where(Collection.status == 'ACTIVE')
+            .order_by(Collection.last_synced_at.asc().nullsfirst())
+            .execution_options(yield_per=50)
         )
-        return result.scalar_one_or_none() is not None
-    
-    async def create_property_from_zillow_data(
-        self, 
-        db: AsyncSession, 
-        property_data: Dict[str, Any]
-    ) -> Property:
+        async for collection_id in result:
+            yield collection_id
+
+    async def get_collection_with_preferences(
+        self,
+        db: AsyncSession,
+        collection_id: str
+    ) -> tuple:
         """
-        Create a new Property record from Zillow data
+        Get a single collection and its preferences in one query, eagerly loading the owner
+        Returns (Collection, CollectionPreferences), (Collection, None) if the collection
+        has no preferences, or (None, None) if not found
         """
-        # Check if property already exists by zpid
-        result = await db.execute(
-            select(Property).where(Property.zpid == property_data.get('zpid'))
-        )
-        existing_property = result.scalar_one_or_none()
-        
-        if existing_property:
-            field_mapping = {
-                'address': 'street_address',
-                'image_url': 'img_src'
-            }
+        result = await db.execute(_COLLECTION_WITH_PREFERENCES_STMT, {'collection_id': collection_id})
+        row = result.first()
+        return (row[0], row[1]) if row else (None, None)
 
-            # Special handling for zpid (string to int conversion)
-            zpid_value = property_data.get('zpid')
-            if zpid_value and str(zpid_value).isdigit():
-                existing_property.zpid = int(zpid_value)
-            
-            for key, value in property_data.items():
-                if value is not None:
-                    # Map field name if necessary
-                    actual_field = field_mapping.get(key, key)
-                    if hasattr(existing_property, actual_field):
-                        setattr(existing_property, actual_field, value)
-            
-            # Note: last_synced field doesn't exist in Property model, using updated_at instead
-            # The updated_at field is automatically updated by SQLAlchemy onupdate
-            
-            await db.commit()
-            await db.refresh(existing_property)
-            return existing_property
-        
-        zpid_value = property_data.get('zpid')
-        zpid_int = int(zpid_value) if zpid_value and str(zpid_value).isdigit() else None
-        
-        property_obj = Property(
-            zpid=zpid_int,
-            street_address=property_data.get('address'),  # ✅ Fixed: address -> street_address
-            city=property_data.get('city'),
-            state=property_data.get('state'),
-            zipcode=property_data.get('zipcode'),
-            price=property_data.get('price'),
-            bedrooms=property_data.get('bedrooms'),
-            bathrooms=property_data.get('bathrooms'),
-            living_area=property_data.get('living_area'),
-            lot_size=property_data.get('lot_size'),
-            home_type=property_data.get('home_type'),
-            home_status=property_data.get('home_status'),
-            latitude=property_data.get('latitude'),
-            longitude=property_data.get('longitude'),
-            img_src=property_data.get('image_url'),
-            zestimate=property_data.get('zestimate')
-        )
-        
-        db.add(property_obj)
-        await db.commit()
-        await db.refresh(property_obj)
-        return property_obj
-    
-    async def add_property_to_collection(
+    async def get_zpids_in_collection(
         self,
         db: AsyncSession,
         collection_id: str,
-        property_id: str
-    ):
+        zpids: List[int]
+    ) -> set:
         """
-        Add a property to a collection (many-to-many relationship) with timestamp.
-        Used for scheduled property sync - properties will show "NEW" badge.
+        Return the subset of zpids whose properties already exist in a collection
         """
-        # Check if relationship already exists
-        result = await db.execute(
-            select(collection_properties)
-            .where(
-                collection_properties.c.collection_id == collection_id,
-                collection_properties.c.property_id == property_id
-            )
-        )
+        existing_zpids = set()
 
-        if result.fetchone() is None:
-            # Insert new relationship with timestamp
-            await db.execute(
-                collection_properties.insert().values(
-                    collection_id=collection_id,
-                    property_id=property_id,
-                    added_at=datetime.now(timezone.utc)
-                )
+        for zpid_batch in _batched(list(zpids)):
+            result = await db.execute(
+                _ZPIDS_IN_COLLECTION_STMT,
+                {'collection_id': collection_id, 'zpids': zpid_batch}
             )
-            await db.commit()
-            # Verbose logging disabled - use summary logs instead
-            # logger.info(f"Added property {property_id} to collection {collection_id}")
+            existing_zpids.update(result.scalars())
 
-    async def add_property_to_collection_initial(
+        return existing_zpids
+    
+    async def get_properties_by_zpid(
         self,
         db: AsyncSession,
         collection_id: str,
-        property_id: str
-    ):
+        zpids: List[int]
+    ) -> tuple:
         """
-        Add a property to a collection WITHOUT timestamp (for initial population).
-        Used when creating a new showcase - properties will NOT show "NEW" badge.
+        Fetch all existing properties for the given zpids in one query, along with
+        which of them are already linked to the collection.
+        Returns (by_zpid: Dict[int, Property], in_collection: Set[int])
         """
-        # Check if relationship already exists
-        result = await db.execute(
-            select(collection_properties)
-            .where(
-                collection_properties.c.collection_id == collection_id,
-                collection_properties.c.property_id == property_id
-            )
-        )
+        by_zpid = {}
+        in_collection = set()
 
-        if result.fetchone() is None:
-            # Insert new relationship WITHOUT added_at (NULL = no "NEW" badge)
-            await db.execute(
-                collection_properties.insert().values(
-                    collection_id=collection_id,
-                    property_id=property_id
-                    # No added_at field = NULL in database
-                )
+        for zpid_batch in _batched(list(zpids)):
+            result = await db.execute(
+                _PROPERTIES_BY_ZPID_STMT,
+                {'collection_id': collection_id, 'zpids': zpid_batch}
             )
-            await db.commit()
-            logger.info(f"Added initial property {property_id} to collection {collection_id} (no timestamp)")
 
-    async def invalidate_collection_property_cache(
+            for property_obj, linked_collection_id in result:
+                by_zpid[property_obj.zpid] = property_obj
+                if linked_collection_id is not None:
+                    in_collection.add(property_obj.zpid)
+
+        return by_zpid, in_collection
+
+    def _property_row_from_zillow_data(self, property_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map parsed Zillow data to Property column values
+        Every column is present (None when missing) so rows can share one multi-row INSERT
+        """
+        return {
+            column: convert(property_data.get(field)) if convert else property_data.get(field)
+            for field, column, convert in ZILLOW_FIELD_MAP
+        }
+
+    async def bulk_upsert_properties(
+        self,
+        db: AsyncSession,
+        property_dicts: List[Dict[str, Any]]
+    ) -> Dict[int, str]:
+        """
+        Insert or update many properties from Zillow data with one prebuilt statement
+        executed for all rows (SQLAlchemy batches them into multi-row INSERTs that stay
+        under SQLite's bound parameter limit).
+        Existing properties (matched on zpid) keep their current value for any field
+        Zillow didn't return. Properties without a valid zpid are skipped.
+        Does NOT commit. Returns mapping of zpid -> property id
+        """
+        rows = {}
+        for property_data in property_dicts:
+            row = self._property_row_from_zillow_data(property_data)
+            if row['zpid'] is not None:
+                rows[row['zpid']] = row
+
+        if not rows:
+            return {}
+
+        result = await db.execute(_PROPERTY_UPSERT_STMT, list(rows.values()))
+        return {zpid: property_id for property_id, zpid in result.all()}
+
+    async def add_properties_to_collection(
+        self,
+        db: AsyncSession,
+        collection_id: str,
+        property_ids: List[str],
+        added_at: datetime = None
+    ) -> int:
+        """
+        Add many properties to a collection with a single executemany INSERT.
+        Relationships that already exist are skipped via ON CONFLICT DO NOTHING.
+        Pass added_at=None for initial population (NULL = no "NEW" badge).
+        Does NOT commit. Returns count of rows inserted.
+        """
+        if not property_ids:
+            return 0
+
+        result = await db.execute(_COLLECTION_PROPERTY_INSERT_STMT, [
+            {'collection_id': collection_id, 'property_id': property_id, 'added_at': added_at}
+            for property_id in property_ids
+        ])
+        return result.rowcount
+
+    async def mark_properties_stale(
+        self,
+        db: AsyncSession,
+        property_ids: List[str]
+    ) -> int:
+        """
+        Age the cached detailed data of specific properties past the fresh window so the
+        next read serves it while revalidating in the background (stale-while-revalidate).
+        Does NOT commit. Returns count of properties marked stale.
+        """
+        stale_at = datetime.now(timezone.utc) - timedelta(hours=CACHE_FRESH_HOURS)
+        stale_count = 0
+
+        for id_batch in _batched(list(property_ids)):
+            stmt = update(Property).where(
+                Property.id.in_(id_batch),
+                Property.detailed_data_cached == True,
+                Property.detailed_data_cached_at > stale_at
+            ).values(
+                detailed_data_cached_at=stale_at
+            ).execution_options(synchronize_session=False)
+
+            update_result = await db.execute(stmt)
+            stale_count += update_result.rowcount
+
+        return stale_count
+
+    async def mark_collection_synced(
         self,
         db: AsyncSession,
         collection_id: str
     ) -> int:
         """
-        Invalidate cached property data for all properties in a collection.
-        Returns count of properties with invalidated cache.
+        Set a collection's last_synced_at to now. Does NOT commit.
+        Returns the number of properties in the collection.
         """
-        from sqlalchemy import update
+        property_count = (
+            select(func.count())
+            .select_from(collection_properties)
+            .where(collection_properties.c.collection_id == Collection.id)
+            .scalar_subquery()
+        )
 
-        # Get all property IDs in this collection
         result = await db.execute(
-            select(collection_properties.c.property_id)
-            .where(collection_properties.c.collection_id == collection_id)
+            update(Collection)
+            .where(Collection.id == collection_id)
+            .values(last_synced_at=datetime.now(timezone.utc))
+            .returning(property_count)
         )
-        property_ids = [row[0] for row in result.fetchall()]
+        return result.scalar() or 0
 
-        if not property_ids:
-            return 0
+    async def fetch_matching_properties(
+        self,
+        db: AsyncSession,
+        collection_id: str,
+        preferences: CollectionPreferences
+    ) -> tuple:
+        """
+        Stream matching properties from Zillow page by page and look up which of them
+        already exist (and are already in the collection) as each page arrives.
+        A producer task keeps fetching pages while the database lookups run.
+        Results are shared with other collections that have the same search preferences
+        for ZILLOW_RESULT_CACHE_TTL_SECONDS.
+        Read-only - writes happen afterwards in one short transaction.
+        Returns (matching_properties, by_zpid, in_collection)
+        """
+        matching_properties = []
+        by_zpid = {}
+        in_collection = set()
+
+        async def process_page(page):
+            # Each collection works on its own copies - pages may be shared between collections
+            page = [dict(property_data) for property_data in page]
+            zpids = _normalize_zpids(page)
+            page_by_zpid, page_in_collection = await self.get_properties_by_zpid(db, collection_id, zpids)
+
+            matching_properties.extend(page)
+            by_zpid.update(page_by_zpid)
+            in_collection.update(page_in_collection)
+
+        fingerprint = _preferences_fingerprint(preferences)
+        shared = self._zillow_results.get(fingerprint)
+        if shared and _fetch_failed(shared.task):
+            # Never hand out a dead fetch - start a fresh one instead
+            del self._zillow_results[fingerprint]
+            shared = None
+        if shared and time.monotonic() - shared.fetched_at < ZILLOW_RESULT_CACHE_TTL_SECONDS:
+            logger.info(f"Reusing Zillow results for identical preferences in collection {collection_id}")
+            shared.waiters += 1
+            try:
+                for page in await self._await_shared_fetch(shared):
+                    await process_page(page)
+            finally:
+                await self._release_shared_fetch(shared)
+            return matching_properties, by_zpid, in_collection
 
-        # Invalidate cache for all these properties
-        stmt = update(Property).where(
-            Property.id.in_(property_ids)
-        ).values(
-            detailed_property=None,
-            detailed_data_cached=False,
-            detailed_data_cached_at=None
-        )
+        pages = asyncio.Queue()
 
-        update_result = await db.execute(stmt)
-        await db.commit()
+        async def produce_pages():
+            fetched_pages = []
+            try:
+                async for page in self.zillow_service.get_matching_properties_stream(preferences):
+                    fetched_pages.append(page)
+                    await pages.put(page)
+            finally:
+                await pages.put(None)
+            return fetched_pages
 
-        logger.info(f"Invalidated cache for {update_result.rowcount} properties in collection {collection_id}")
-        return update_result.rowcount
+        producer = asyncio.create_task(produce_pages())
+        shared = _SharedFetch(fetched_at=time.monotonic(), task=producer, waiters=1)
+        self._zillow_results[fingerprint] = shared
+
+        def forget_failed_fetch(task):
+            # Don't hand a failed Zillow call to other collections - let them retry
+            if self._zillow_results.get(fingerprint) is shared and _fetch_failed(task):
+                del self._zillow_results[fingerprint]
+
+        producer.add_done_callback(forget_failed_fetch)
+
+        try:
+            while (page := await pages.get()) is not None:
+                await process_page(page)
+        finally:
+            # Stop calling Zillow if processing a page failed - unless other collections still wait on it
+            await self._release_shared_fetch(shared)
+            # Drop a failed fetch now rather than on the next loop iteration
+            forget_failed_fetch(producer)
+
+        # Surface any Zillow error raised by the producer
+        await self._await_shared_fetch(shared)
+
+        return matching_properties, by_zpid, in_collection
 
     async def sync_collection_properties(
         self,
@@ -256,118 +554,108 @@ class PropertySyncService:
     ) -> Dict[str, Any]:
         """
         Sync properties for a single collection based on its preferences
+        All writes run in one transaction (a savepoint, so a failure only discards this
+        collection's work) that is committed once at the end
         Returns dict with new_properties_count, collection, and total_properties
         """
-        logger.info(f"Syncing properties for collection {collection.id}")
+        collection_id = collection.id
+        logger.info(f"Syncing properties for collection {collection_id}")
 
+        savepoint = None
         try:
-            # Get matching properties from Zillow
-            matching_properties = await self.zillow_service.get_matching_properties(preferences)
+            # Get matching properties from Zillow, pre-fetching existing properties and
+            # collection membership for each page while the next one is still in flight
+            matching_properties, by_zpid, in_collection = await self.fetch_matching_properties(
+                db, collection_id, preferences
+            )
+
+            new_property_ids = []
+            new_properties = []
+            price_drops = []
 
-            new_properties_count = 0
-            first_new_property = None
+            new_property_data = {}
+            changed_property_ids = []
 
             for property_data in matching_properties:
-                zpid = property_data.get('zpid')
-                if not zpid:
+                zpid_int = property_data['zpid']
+                if zpid_int is None:
                     continue
 
+                # Only properties whose key fields changed need their detailed cache invalidated
+                known_property = by_zpid.get(zpid_int)
+                if known_property and any(
+                    property_data.get(field) is not None and property_data.get(field) != getattr(known_property, field)
+                    for field in CACHE_INVALIDATING_FIELDS
+                ):
+                    changed_property_ids.append(known_property.id)
+
                 # Check if property already exists in this collection
-                if await self.property_exists_in_collection(db, collection.id, zpid):
+                if zpid_int in in_collection:
                     # Property exists - check for price drop
-                    result = await db.execute(
-                        select(Property).where(Property.zpid == zpid)
-                    )
-                    existing_property = result.scalar_one_or_none()
+                    existing_property = by_zpid.get(zpid_int)
 
                     if existing_property:
                         old_price = existing_property.price  # OLD price from database
                         new_price = property_data.get('price')  # NEW price from Zillow
 
-                        # Check for price drop
+                        # Check for price drop - collected for the digest email sent after the sync
                         if old_price and new_price and new_price < old_price:
-                            # Price dropped! Send notification
-                            visitor_email = collection.visitor_email
-                            visitor_name = collection.visitor_name or "Valued Visitor"
-                            collection_name = collection.name
-
-                            # Build collection link
-                            frontend_url = os.getenv('FRONTEND_URL', os.getenv('CLIENT_URL', 'http://localhost:3000'))
-                            collection_link = f"{frontend_url}/showcase/{collection.share_token}"
-
-                            # Calculate savings
                             savings = old_price - new_price
                             discount_percent = round((savings / old_price) * 100, 1)
 
-                            # Get agent info
-                            agent_result = await db.execute(
-                                select(User).where(User.id == collection.owner_id)
-                            )
-                            agent = agent_result.scalar_one_or_none()
-                            agent_name = f"{agent.first_name or ''} {agent.last_name or ''}".strip() if agent else ""
-                            agent_email = agent.email if agent else ""
-                            agent_phone = ""  # User model doesn't have phone field
-
-                            if visitor_email:
-                                email_service = EmailService()
-                                email_service.send_simple_message(
-                                    to_email=visitor_email,
-                                    subject=f"Price Drop Alert - {collection_name}",
-                                    template="price_drop_alert",
-                                    template_variables={
-                                        "recipient_name": visitor_name,
-                                        "collection_name": collection_name,
-                                        "collection_link": collection_link,
-                                        "property_address": existing_property.street_address,
-                                        "property_image": existing_property.img_src,
-                                        "old_price": f"${old_price:,}",
-                                        "new_price": f"${new_price:,}",
-                                        "savings": f"${savings:,}",
-                                        "discount_percent": f"{discount_percent}%",
-                                        "agent_name": agent_name,
-                                        "agent_email": agent_email,
-                                        "agent_phone": agent_phone
-                                    }
-                                )
-                                logger.info(f"Price drop email sent for property {zpid}: ${old_price:,} → ${new_price:,}")
-
-                    # Update property with new data
-                    property_obj = await self.create_property_from_zillow_data(db, property_data)
+                            price_drops.append({
+                                "property_address": existing_property.street_address,
+                                "property_image": existing_property.img_src,
+                                "old_price": f"${old_price:,}",
+                                "new_price": f"${new_price:,}",
+                                "savings": f"${savings:,}",
+                                "discount_percent": f"{discount_percent}%"
+                            })
+                            logger.info(f"Price drop detected for property {zpid_int}: ${old_price:,} → ${new_price:,}")
+
                     continue  # Don't count as new property
 
-                # Create or update property
-                property_obj = await self.create_property_from_zillow_data(db, property_data)
-
-                # Add property to collection
-                await self.add_property_to_collection(db, collection.id, property_obj.id)
-                new_properties_count += 1
-
-                # Track the first new property for email template
-                if new_properties_count == 1:
-                    first_new_property = {
-                        'address': property_obj.street_address,
-                        'beds': property_obj.bedrooms,
-                        'baths': property_obj.bathrooms,
-                        'price': property_obj.price,
-                        'sqft': property_obj.living_area,
-                        'image': property_obj.img_src
-                    }
-
-            # Get total property count without lazy loading
-            count_result = await db.execute(
-                select(func.count()).select_from(collection_properties).where(
-                    collection_properties.c.collection_id == collection.id
-                )
+                # Later duplicates of the same zpid in the Zillow results are ignored
+                new_property_data.setdefault(zpid_int, property_data)
+
+            # Writes start here - opening the savepoint only now keeps SQLite from holding a
+            # read lock across the Zillow call and the lookups above
+            savepoint = await db.begin_nested()
+
+            # Create or update every matching property in one statement
+            id_by_zpid = await self.bulk_upsert_properties(db, matching_properties)
+
+            for zpid_int, property_data in new_property_data.items():
+                new_property_ids.append(id_by_zpid[zpid_int])
+
+                # Track new property details for the digest email
+                price = property_data.get('price')
+                living_area = property_data.get('living_area')
+                new_properties.append({
+                    'address': property_data.get('address'),
+                    'beds': property_data.get('bedrooms'),
+                    'baths': property_data.get('bathrooms'),
+                    'price': f"${price:,}" if price else '',
+                    'sqft': f"{living_area:,}" if living_area else '',
+                    'image': property_data.get('image_url')
+                })
+
+            # Link all new properties to the collection in one statement
+            await self.add_properties_to_collection(
+                db, collection.id, new_property_ids, added_at=datetime.now(timezone.utc)
             )
-            total_properties = count_result.scalar()
+            new_properties_count = len(new_property_ids)
 
             logger.info(f"Added {new_properties_count} new properties to collection {collection.id}")
 
-            # Invalidate cache for all properties in this collection
-            await self.invalidate_collection_property_cache(db, collection.id)
+            # Properties whose price/status/zestimate changed get their cache revalidated on next read
+            stale_count = await self.mark_properties_stale(db, changed_property_ids)
+            if stale_count:
+                logger.info(f"Marked cache stale for {stale_count} changed properties in collection {collection.id}")
 
-            # Update last_synced_at timestamp
-            collection.last_synced_at = datetime.now(timezone.utc)
+            # Update last_synced_at timestamp, returning the collection's total property count
+            # from the same statement instead of a separate count query
+            total_properties = await self.mark_collection_synced(db, collection_id)
             await db.commit()
             await db.refresh(collection)
 
@@ -375,26 +663,144 @@ class PropertySyncService:
                 'new_properties_count': new_properties_count,
                 'collection': collection,
                 'total_properties': total_properties,
-                'first_new_property': first_new_property if new_properties_count > 0 else None
+                'new_properties': new_properties,
+                'price_drops': price_drops
             }
 
         except Exception as e:
-            logger.error(f"Error syncing collection {collection.id}", exc_info=True, extra={"collection_id": collection.id})
+            logger.error(f"Error syncing collection {collection_id}", exc_info=True, extra={"collection_id": collection_id})
 
-            # Update last_synced_at even on failure to prevent this collection from blocking others
+            # Discard the partial sync, then update last_synced_at even on failure
+            # to prevent this collection from blocking others
             try:
-                collection.last_synced_at = datetime.now(timezone.utc)
+                if savepoint is not None and savepoint.is_active:
+                    await savepoint.rollback()
+                await self.mark_collection_synced(db, collection_id)
                 await db.commit()
                 await db.refresh(collection)
             except Exception as commit_error:
-                logger.error(f"Failed to update last_synced_at for collection {collection.id}", exc_info=True)
+                logger.error(f"Failed to update last_synced_at for collection {collection_id}", exc_info=True)
 
             return {
                 'new_properties_count': 0,
                 'collection': collection,
-                'total_properties': 0
+                'total_properties': 0,
+                'new_properties': [],
+                'price_drops': []
             }
-    
+
+    async def send_collection_update_digest(
+        self,
+        db: AsyncSession,
+        collection: Collection,
+        sync_result: Dict[str, Any]
+    ) -> None:
+        """
+        Send a single digest email to the visitor and the agent summarizing
+        all new properties and price drops found during a collection sync
+        Expects collection.owner to be eagerly loaded (see SYNC_LOAD_OPTIONS)
+        """
+        new_properties = sync_result.get('new_properties') or []
+        price_drops = sync_result.get('price_drops') or []
+
+        if not new_properties and not price_drops:
+            return
+
+        visitor_email = collection.visitor_email
+        share_token = collection.share_token
+        if not visitor_email or not share_token:
+            return
+
+        visitor_name = collection.visitor_name or "Valued Visitor"
+        collection_name = collection.name
+
+        # Agent info - owner is eagerly loaded with the collection
+        agent = collection.owner
+
+        # Build collection link
+        collection_link = f"{FRONTEND_URL}/showcase/{share_token}"
+
+        # Extract agent info for email
+        agent_name = f"{agent.first_name or ''} {agent.last_name or ''}".strip() if agent else ""
+        agent_email = agent.email if agent else ""
+        agent_phone = ""  # User model doesn't have phone field
+
+        # Send to visitor
+        schedule_email(
+            to_email=visitor_email,
+            subject=f"Updates to Your Collection - {collection_name}",
+            template="collection_update_digest",
+            template_variables={
+                "recipient_name": visitor_name,
+                "collection_name": collection_name,
+                "collection_link": collection_link,
+                "new_count": len(new_properties),
+                "price_drop_count": len(price_drops),
+                "total_count": sync_result.get('total_properties', 0),
+                "new_properties": new_properties,
+                "price_drops": price_drops,
+                "agent_name": agent_name,
+                "agent_email": agent_email,
+                "agent_phone": agent_phone
+            }
+        )
+
+        # Send to agent (different template)
+        if agent and agent.email:
+            schedule_email(
+                to_email=agent.email,
+                subject=f"Updates to {visitor_name}'s Collection",
+                template="collection_update_digest_agent",
+                template_variables={
+                    "recipient_name": agent.first_name,
+                    "collection_name": collection_name,
+                    "collection_link": collection_link,
+                    "visitor_name": visitor_name,
+                    "new_count": len(new_properties),
+                    "price_drop_count": len(price_drops),
+                    "total_count": sync_result.get('total_properties', 0),
+                    "new_properties": new_properties,
+                    "price_drops": price_drops
+                }
+            )
+
+        logger.info(
+            f"Digest email scheduled for collection {collection.id}: "
+            f"{len(new_properties)} new properties, {len(price_drops)} price drops"
+        )
+
+    async def sync_collections_concurrently(self, collection_ids: List[str]) -> List[Any]:
+        """
+        Sync collections concurrently (bounded by SYNC_CONCURRENCY), each in its own session,
+        and send each collection's update digest
+        Returns a sync result or the raised exception for each collection id, in order
+        """
+        # Import here to avoid circular imports and ensure proper async context
+        from app.database import AsyncSessionLocal
+
+        semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+
+        async def sync_one(collection_id: str) -> Dict[str, Any]:
+            # Each concurrent sync gets its own session - AsyncSession is not safe to share across tasks
+            async with semaphore, AsyncSessionLocal() as db:
+                collection, preferences = await self.get_collection_with_preferences(db, collection_id)
+                if not collection:
+                    raise ValueError("Collection not found")
+                if not preferences:
+                    raise ValueError("No preferences found for collection")
+
+                async with self._query_budget(db, "sync_collection_properties"):
+                    sync_result = await self.sync_collection_properties(db, collection, preferences)
+
+                # One digest email per visitor/agent covering new properties and price drops
+                await self.send_collection_update_digest(db, collection, sync_result)
+                return sync_result
+
+        return await asyncio.gather(
+            *[sync_one(collection_id) for collection_id in collection_ids],
+            return_exceptions=True
+        )
+
     async def sync_all_active_collections(self) -> Dict[str, Any]:
         """
         Sync all active collections with their preferences
@@ -412,110 +818,30 @@ class PropertySyncService:
         
         # Import here to avoid circular imports and ensure proper async context
         from app.database import AsyncSessionLocal
-        
+
         try:
             async with AsyncSessionLocal() as db:
                 try:
-                    # Get all active collections with preferences
-                    collections_with_preferences = await self.get_active_collections_with_preferences(db)
-                    
-                    for collection, preferences in collections_with_preferences:
-                        try:
-                            # Capture attributes before any async operations that might detach the object
-                            collection_id = collection.id
-                            visitor_email = collection.visitor_email
-                            visitor_name = collection.visitor_name or "Valued Visitor"
-                            share_token = collection.share_token
-                            collection_name = collection.name
-
-                            sync_result = await self.sync_collection_properties(db, collection, preferences)
-                            sync_results['collections_processed'] += 1
-                            sync_results['total_new_properties'] += sync_result['new_properties_count']
-
-                            # Send email notifications to visitor and agent if new properties were added
-                            if sync_result['new_properties_count'] > 0 and visitor_email and share_token:
-                                # Get agent info
-                                agent_result = await db.execute(
-                                    select(User).where(User.id == collection.owner_id)
-                                )
-                                agent = agent_result.scalar_one_or_none()
-
-                                # Build collection link
-                                frontend_url = os.getenv('FRONTEND_URL', os.getenv('CLIENT_URL', 'http://localhost:3000'))
-                                collection_link = f"{frontend_url}/showcase/{share_token}"
-                                collection_link_agent = f"{frontend_url}/showcase?showcase={collection_id}"
-
-                                # Extract agent info for email
-                                agent_name = f"{agent.first_name or ''} {agent.last_name or ''}".strip() if agent else ""
-                                agent_email = agent.email if agent else ""
-                                agent_phone = ""  # User model doesn't have phone field
-
-                                # Extract first property details for email
-                                first_prop = sync_result.get('first_new_property') or {}
-                                property_address = first_prop.get('address', '')
-                                property_beds = first_prop.get('beds', '')
-                                property_baths = first_prop.get('baths', '')
-                                property_price = f"${first_prop['price']:,}" if first_prop.get('price') else ''
-                                property_sqft = f"{first_prop['sqft']:,}" if first_prop.get('sqft') else ''
-                                property_image = first_prop.get('image', '')
-
-                                # Send to visitor
-                                self.email_service.send_simple_message(
-                                    to_email=visitor_email,
-                                    subject=f"New Properties Added to Your Collection - {collection_name}",
-                                    template="new_properties_synced",
-                                    template_variables={
-                                        "recipient_name": visitor_name,
-                                        "collection_name": collection_name,
-                                        "new_count": sync_result['new_properties_count'],
-                                        "total_count": sync_result['total_properties'],
-                                        "collection_link": collection_link,
-                                        "agent_name": agent_name,
-                                        "agent_email": agent_email,
-                                        "agent_phone": agent_phone,
-                                        "property_address": property_address,
-                                        "property_beds": property_beds,
-                                        "property_baths": property_baths,
-                                        "property_price": property_price,
-                                        "property_sqft": property_sqft,
-                                        "property_image": property_image
-                                    }
-                                )
-
-                                # Send to agent (different template)
-                                if agent and agent.email:
-                                    self.email_service.send_simple_message(
-                                        to_email=agent.email,
-                                        subject=f"New Properties Added to {visitor_name}'s Collection",
-                                        template="new_properties_synced_agent",
-                                        template_variables={
-                                            "recipient_name": agent.first_name,
-                                            "collection_name": collection_name,
-                                            "new_count": sync_result['new_properties_count'],
-                                            "total_count": sync_result['total_properties'],
-                                            "collection_link": collection_link,
-                                            "visitor_name": visitor_name,
-                                            "property_address": property_address,
-                                            "property_beds": property_beds,
-                                            "property_baths": property_baths,
-                                            "property_price": property_price,
-                                            "property_sqft": property_sqft,
-                                            "property_image": property_image
-                                        }
-                                    )
-
-                                logger.info(
-                                    f"Email notifications sent for collection {collection_id}: "
-                                    f"{sync_result['new_properties_count']} new properties"
-                                )
-
-                            # Add small delay between collection syncs to be respectful to API
-                            await asyncio.sleep(0.2)
-
-                        except Exception as e:
-                            error_msg = f"Failed to sync collection {collection.id}: {str(e)}"
+                    # Get all active collections with preferences (ids only - each sync loads its own collection)
+                    collection_ids = [
+                        collection_id async for collection_id in self.stream_active_collection_ids(db)
+                    ]
+
+                    results = await self.sync_collections_concurrently(collection_ids)
+
+                    for collection_id, result in zip(collection_ids, results):
+                        # gather() also returns a CancelledError raised by one collection's sync
+                        if isinstance(result, BaseException):
+                            error_msg = f"Failed to sync collection {collection_id}: {str(result) or type(result).__name__}"
                             logger.error(error_msg)
                             sync_results['errors'].append(error_msg)
+                            continue
+
+                        sync_results['collections_processed'] += 1
+                        sync_results['total_new_properties'] += result['new_properties_count']
+
+                    # Make sure every digest email has gone out before reporting completion
+                    await flush_emails()
                     
                     sync_results['completed_at'] = datetime.now()
                     sync_results['duration_seconds'] = (
@@ -553,18 +879,11 @@ class PropertySyncService:
         async with AsyncSessionLocal() as db:
             try:
                 # Get collection and preferences
-                result = await db.execute(
-                    select(Collection).where(Collection.id == collection_id)
-                )
-                collection = result.scalar_one_or_none()
-                
+                collection, preferences = await self.get_collection_with_preferences(db, collection_id)
+
                 if not collection:
                     return {'success': False, 'error': 'Collection not found'}
-                
-                preferences = await CollectionPreferencesService.get_preferences_by_collection_id(
-                    db, collection_id
-                )
-                
+
                 if not preferences:
                     return {'success': False, 'error': 'No preferences found for collection'}
                 
@@ -594,18 +913,11 @@ class PropertySyncService:
 
         try:
             # Get collection and preferences
-            result = await db.execute(
-                select(Collection).where(Collection.id == collection_id)
-            )
-            collection = result.scalar_one_or_none()
+            collection, preferences = await self.get_collection_with_preferences(db, collection_id)
 
             if not collection:
                 return {'success': False, 'error': 'Collection not found'}
 
-            preferences = await CollectionPreferencesService.get_preferences_by_collection_id(
-                db, collection_id
-            )
-
             if not preferences:
                 logger.warning(f"No preferences found for new collection {collection_id}, skipping property population")
                 return {'success': True, 'new_properties_added': 0, 'message': 'No preferences to populate from'}
@@ -613,23 +925,22 @@ class PropertySyncService:
             # Get matching properties from Zillow
             matching_properties = await self.zillow_service.get_matching_properties(preferences)
 
-            properties_added = 0
-
-            for property_data in matching_properties:
-                zpid = property_data.get('zpid')
-                if not zpid:
-                    continue
+            # Find properties already in this collection with a single query
+            zpids = _normalize_zpids(matching_properties)
+            existing_zpids = await self.get_zpids_in_collection(db, collection.id, zpids)
 
-                # Check if property already exists in this collection
-                if await self.property_exists_in_collection(db, collection.id, zpid):
-                    continue
+            new_property_data = [
+                property_data for property_data in matching_properties
+                if property_data['zpid'] is not None and property_data['zpid'] not in existing_zpids
+            ]
 
-                # Create or update property
-                property_obj = await self.create_property_from_zillow_data(db, property_data)
+            # Create or update all new properties in one statement
+            id_by_zpid = await self.bulk_upsert_properties(db, new_property_data)
+            new_property_ids = list(id_by_zpid.values())
 
-                # Add property WITHOUT timestamp (initial population - no "NEW" badge)
-                await self.add_property_to_collection_initial(db, collection.id, property_obj.id)
-                properties_added += 1
+            # Add properties WITHOUT timestamp (initial population - no "NEW" badge)
+            properties_added = await self.add_properties_to_collection(db, collection.id, new_property_ids)
+            await db.commit()
 
             logger.info(f"Successfully populated new collection {collection_id} with {properties_added} initial properties (no timestamps)")
 
@@ -650,6 +961,29 @@ class PropertySyncService:
                 'new_properties_added': 0
             }
 
+    async def persist_collection_properties(
+        self,
+        db: AsyncSession,
+        collection_id: str,
+        matching_properties: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Replace a collection's property links with already-fetched Zillow properties.
+        Does NOT commit. Returns count of properties linked.
+        """
+        # Step 3: Now safe to delete existing properties (we have new ones to replace with)
+        await db.execute(
+            collection_properties.delete().where(
+                collection_properties.c.collection_id == collection_id
+            )
+        )
+
+        # Step 4: Upsert the matching properties and link them to the collection in bulk
+        id_by_zpid = await self.bulk_upsert_properties(db, matching_properties)
+        return await self.add_properties_to_collection(
+            db, collection_id, list(id_by_zpid.values())
+        )
+
     async def replace_collection_properties(self, db: AsyncSession, collection_id: str) -> Dict[str, Any]:
         """
         Replace all properties in a collection with new ones based on updated preferences.
@@ -659,18 +993,15 @@ class PropertySyncService:
         logger.info(f"Replacing all properties for collection {collection_id}")
 
         try:
-            # Get collection and preferences
-            result = await db.execute(
-                select(Collection).where(Collection.id == collection_id)
-            )
-            collection = result.scalar_one_or_none()
+            # Get collection and preferences. Pending preference edits from the caller are not
+            # flushed here (the identity map still returns them), so no write transaction is
+            # opened - and no database lock held - while waiting on Zillow
+            with db.no_autoflush:
+                collection, preferences = await self.get_collection_with_preferences(db, collection_id)
 
             if not collection:
                 return {'success': False, 'error': 'Collection not found'}
 
-            # Get preferences for this collection
-            preferences = await CollectionPreferencesService.get_preferences_by_collection_id(db, collection_id)
-
             if not preferences:
                 return {'success': False, 'error': 'No preferences found for collection'}
 
@@ -686,34 +1017,9 @@ class PropertySyncService:
                     'properties_replaced': 0
                 }
 
-            # Step 3: Now safe to delete existing properties (we have new ones to replace with)
-            await db.execute(
-                collection_properties.delete().where(
-                    collection_properties.c.collection_id == collection_id
-                )
-            )
-            # Verbose logging disabled - use summary logs instead
-            # logger.info(f"Removed all existing property associations for collection {collection_id}")
-
-            properties_added = 0
-
-            # Step 4: Add new matching properties to the collection
-            for property_data in matching_properties:
-                zpid = property_data.get('zpid')
-                if not zpid:
-                    continue
-
-                try:
-                    # Create or update property in database
-                    property_obj = await self.create_property_from_zillow_data(db, property_data)
-
-                    # Add property to collection
-                    await self.add_property_to_collection(db, collection_id, property_obj.id)
-                    properties_added += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to add property {zpid} to collection {collection_id}: {str(e)}")
-                    continue
+            # Steps 3-4: database writes only, after the Zillow call has completed
+            async with self._query_budget(db, "replace_collection_properties"):
+                properties_added = await self.persist_collection_properties(db, collection_id, matching_properties)
 
             # CRITICAL: Do NOT commit here - let the caller handle commit
             # This ensures atomic updates with preferences
@@ -734,3 +1040,9 @@ class PropertySyncService:
                 'collection_id': collection_id,
                 'error': str(e)
             }
+
+
+@lru_cache(maxsize=1)
+def get_property_sync_service() -> PropertySyncService:
+    """Shared PropertySyncService instance, so every caller shares one Zillow result cache"""
+    return PropertySyncService()
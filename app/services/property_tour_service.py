@@ -1,7 +1,9 @@
+from functools import lru_cache
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, update, and_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.models.database import PropertyTour, Collection, Property, User, Notification
 from app.schemas.property_tour import (
@@ -9,31 +11,48 @@ from app.schemas.property_tour import (
     PropertyTourResponse,
     PropertyTourStatusUpdate
 )
-from app.services.email_service import EmailService
+from app.services.email_service import schedule_email
 from app.config.logging import get_logger
 
 logger = get_logger(__name__)
 
+_TOUR_STATUSES = ("PENDING", "CONFIRMED", "CANCELLED")
+_VALID_TOUR_STATUSES = frozenset(_TOUR_STATUSES)
+_INVALID_TOUR_STATUS_ERROR = f"Invalid status. Must be one of: {', '.join(_TOUR_STATUSES)}"
+
+# (date, time) field pairs of the preferred tour slots, in order
+_PREFERRED_DATE_SLOTS = (
+    ("preferred_date", "preferred_time"),
+    ("preferred_date_2", "preferred_time_2"),
+    ("preferred_date_3", "preferred_time_3"),
+)
+
+# Columns backing PropertyTourResponse, so list endpoints can skip ORM hydration
+_TOUR_RESPONSE_COLUMNS = tuple(getattr(PropertyTour, field) for field in PropertyTourResponse.model_fields)
+
 
 class PropertyTourService:
     """Service for managing property tour requests within collections"""
 
+    # Tour dates and times repeat a lot across requests, so parsed results are memoized
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _format_date(date_str: str) -> str:
         """Convert YYYY-MM-DD to MM/DD/YYYY"""
         try:
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
             return date_obj.strftime("%m/%d/%Y")
-        except:
+        except (ValueError, TypeError):
             return date_str  # Return original if parsing fails
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _format_time(time_str: str) -> str:
         """Convert HH:MM (24-hour) to 12-hour AM/PM format"""
         try:
             time_obj = datetime.strptime(time_str, "%H:%M")
             return time_obj.strftime("%-I:%M %p")  # %-I removes leading zero from hour
-        except:
+        except (ValueError, TypeError):
             return time_str  # Return original if parsing fails
 
     @classmethod
@@ -47,12 +66,28 @@ class PropertyTourService:
     ) -> PropertyTourResponse:
         """Create a new property tour request"""
 
-        # Verify collection exists and is public
-        collection_result = await db.execute(
-            select(Collection).where(Collection.id == collection_id)
+        # Fetch only the collection, property and agent columns used below in one round-trip
+        result = await db.execute(
+            select(
+                Collection.is_public,
+                Collection.name,
+                Collection.owner_id,
+                Collection.visitor_name,
+                Collection.visitor_email,
+                Collection.visitor_phone,
+                Property.id.label("property_id"),
+                Property.street_address,
+                User.email.label("agent_email"),
+                User.first_name.label("agent_first_name")
+            )
+            .select_from(Collection)
+            .outerjoin(Property, Property.id == property_id)
+            .outerjoin(User, User.id == Collection.owner_id)
+            .where(Collection.id == collection_id)
         )
-        collection = collection_result.scalar_one_or_none()
+        collection = result.first()
 
+        # Verify collection exists and is public
         if not collection:
             raise ValueError("Collection not found")
 
@@ -64,31 +99,14 @@ class PropertyTourService:
             raise ValueError("Collection does not have complete visitor information")
 
         # Verify property exists
-        property_result = await db.execute(
-            select(Property).where(Property.id == property_id)
-        )
-        property_obj = property_result.scalar_one_or_none()
-
-        if not property_obj:
+        if not collection.property_id:
             raise ValueError("Property not found")
 
-        # Check if a tour already exists for this collection + property
-        existing_tour_result = await db.execute(
-            select(PropertyTour).where(
-                and_(
-                    PropertyTour.collection_id == collection_id,
-                    PropertyTour.property_id == property_id
-                )
-            )
-        )
-        existing_tour = existing_tour_result.scalar_one_or_none()
-
-        if existing_tour:
-            raise ValueError("A tour has already been requested for this property")
-
-        # Create tour request using visitor info from collection
-        current_time = datetime.now()
-        tour = PropertyTour(
+        # Create tour request using visitor info from collection. The unique
+        # (collection_id, property_id) index rejects a second tour for the same property,
+        # so the duplicate check and the insert are one race-free statement
+        now = datetime.now(timezone.utc)
+        insert_stmt = sqlite_insert(PropertyTour).values(
             collection_id=collection_id,
             property_id=property_id,
             visitor_name=collection.visitor_name,
@@ -102,52 +120,18 @@ class PropertyTourService:
             preferred_time_3=tour_data.preferred_time_3,
             message=tour_data.message,
             status="PENDING",
-            created_at=current_time,
-            updated_at=current_time
-        )
+            created_at=now,
+            updated_at=now
+        ).on_conflict_do_nothing(
+            index_elements=['collection_id', 'property_id']
+        ).returning(PropertyTour)
 
-        db.add(tour)
-        await db.commit()
-        await db.refresh(tour)
+        tour = (await db.execute(insert_stmt)).scalar_one_or_none()
 
-        # Send email notification to the agent
-        agent_result = await db.execute(
-            select(User).where(User.id == collection.owner_id)
-        )
-        agent = agent_result.scalar_one_or_none()
-        if agent and agent.email:
-            # Build preferred dates list with formatted dates and times
-            preferred_dates = []
-            if tour_data.preferred_date and tour_data.preferred_time:
-                formatted_date = cls._format_date(tour_data.preferred_date)
-                formatted_time = cls._format_time(tour_data.preferred_time)
-                preferred_dates.append(f"{formatted_date} at {formatted_time}")
-            if tour_data.preferred_date_2 and tour_data.preferred_time_2:
-                formatted_date = cls._format_date(tour_data.preferred_date_2)
-                formatted_time = cls._format_time(tour_data.preferred_time_2)
-                preferred_dates.append(f"{formatted_date} at {formatted_time}")
-            if tour_data.preferred_date_3 and tour_data.preferred_time_3:
-                formatted_date = cls._format_date(tour_data.preferred_date_3)
-                formatted_time = cls._format_time(tour_data.preferred_time_3)
-                preferred_dates.append(f"{formatted_date} at {formatted_time}")
-
-            email_service = EmailService()
-            email_service.send_simple_message(
-                to_email=agent.email,
-                subject=f"New Tour Request - {property_obj.street_address}",
-                template="tour_request",
-                template_variables={
-                    "agent_name": agent.first_name,
-                    "visitor_name": collection.visitor_name,
-                    "visitor_email": collection.visitor_email,
-                    "visitor_phone": collection.visitor_phone or "Not provided",
-                    "property_address": property_obj.street_address,
-                    "preferred_dates": ", ".join(preferred_dates) if preferred_dates else "No specific dates provided",
-                    "message": tour_data.message or ""
-                }
-            )
+        if not tour:
+            raise ValueError("A tour has already been requested for this property")
 
-        # Create in-app notification for agent
+        # Create in-app notification for agent in the same transaction as the tour
         try:
             # Skip notification if the user is the agent (owner) themselves
             if not (user_id and user_id == collection.owner_id):
@@ -158,29 +142,56 @@ class PropertyTourService:
                     formatted_time = cls._format_time(tour_data.preferred_time)
                     preferred_date_str = f" for {formatted_date} at {formatted_time}"
 
-                notification = Notification(
+                # Core INSERT - the notification is write-only here, so skip the ORM unit of work
+                await db.execute(insert(Notification).values(
                     agent_id=collection.owner_id,
                     type="TOUR_REQUEST",
                     reference_type="TOUR",
                     reference_id=tour.id,
                     title=f"New Tour Request: {collection.visitor_name}",
-                    message=f"Requested tour at {property_obj.street_address}{preferred_date_str}",
-                    collection_id=collection.id,
+                    message=f"Requested tour at {collection.street_address}{preferred_date_str}",
+                    collection_id=collection_id,
                     collection_name=collection.name,
                     property_id=property_id,
-                    property_address=property_obj.street_address,
+                    property_address=collection.street_address,
                     visitor_name=collection.visitor_name,
-                    link=f"/showcases?showcase={collection.id}&property={property_id}",
+                    link=f"/showcases?showcase={collection_id}&property={property_id}",
                     is_read=False,
-                    created_at=datetime.utcnow()
-                )
-                db.add(notification)
-                await db.commit()
+                    created_at=now
+                ))
         except Exception as e:
             logger.error("Failed to create tour request notification", extra={"error": str(e)})
-            # Don't fail the tour request if notification creation fails
+            # Don't fail the tour request if creating the notification fails
+
+        await db.commit()
+
+        # Send email notification to the agent
+        if collection.agent_email:
+            # Build preferred dates list with formatted dates and times
+            preferred_dates = []
+            for date_field, time_field in _PREFERRED_DATE_SLOTS:
+                preferred_date = getattr(tour_data, date_field)
+                preferred_time = getattr(tour_data, time_field)
+                if preferred_date and preferred_time:
+                    preferred_dates.append(f"{cls._format_date(preferred_date)} at {cls._format_time(preferred_time)}")
+
+            schedule_email(
+                to_email=collection.agent_email,
+                subject=f"New Tour Request - {collection.street_address}",
+                template="tour_request",
+                template_variables={
+                    "agent_name": collection.agent_first_name,
+                    "visitor_name": collection.visitor_name,
+                    "visitor_email": collection.visitor_email,
+                    "visitor_phone": collection.visitor_phone or "Not provided",
+                    "property_address": collection.street_address,
+                    "preferred_dates": ", ".join(preferred_dates) if preferred_dates else "No specific dates provided",
+                    "message": tour_data.message or ""
+                }
+            )
+
 
-        return PropertyTourResponse.from_orm(tour)
+        return PropertyTourResponse.model_validate(tour)
 
     @classmethod
     async def get_collection_tours(
@@ -190,14 +201,16 @@ class PropertyTourService:
     ) -> List[PropertyTourResponse]:
         """Get all tour requests for a collection"""
 
-        result = await db.execute(
-            select(PropertyTour)
+        # Stream rows in chunks so a collection with many tours isn't buffered twice
+        result = await db.stream(
+            select(*_TOUR_RESPONSE_COLUMNS)
             .where(PropertyTour.collection_id == collection_id)
             .order_by(PropertyTour.created_at.desc())
+            .execution_options(yield_per=200)
         )
-        tours = result.scalars().all()
 
-        return [PropertyTourResponse.from_orm(tour) for tour in tours]
+        # Rows come straight from the database, so skip re-validating each one
+        return [PropertyTourResponse.model_construct(**tour) async for tour in result.mappings()]
 
     @classmethod
     async def get_property_tours(
@@ -209,7 +222,7 @@ class PropertyTourService:
         """Get all tour requests for a specific property in a collection"""
 
         result = await db.execute(
-            select(PropertyTour)
+            select(*_TOUR_RESPONSE_COLUMNS)
             .where(
                 and_(
                     PropertyTour.collection_id == collection_id,
@@ -218,9 +231,8 @@ class PropertyTourService:
             )
             .order_by(PropertyTour.created_at.desc())
         )
-        tours = result.scalars().all()
 
-        return [PropertyTourResponse.from_orm(tour) for tour in tours]
+        return [PropertyTourResponse.model_construct(**tour) for tour in result.mappings()]
 
     @classmethod
     async def get_tour_by_id(
@@ -230,15 +242,13 @@ class PropertyTourService:
     ) -> Optional[PropertyTourResponse]:
         """Get a specific tour request by ID"""
 
-        result = await db.execute(
-            select(PropertyTour).where(PropertyTour.id == tour_id)
-        )
-        tour = result.scalar_one_or_none()
+        # Primary key lookup - served from the identity map when already loaded
+        tour = await db.get(PropertyTour, tour_id)
 
         if not tour:
             return None
 
-        return PropertyTourResponse.from_orm(tour)
+        return PropertyTourResponse.model_validate(tour)
 
     @classmethod
     async def update_tour_status(
@@ -250,39 +260,41 @@ class PropertyTourService:
     ) -> Optional[PropertyTourResponse]:
         """Update the status of a tour request (agent only)"""
 
-        # Get the tour
+        # Validate status - a missing or foreign tour is still reported first, as before
+        if status_update.status not in _VALID_TOUR_STATUSES:
+            tour_owner = (await db.execute(
+                select(PropertyTour.id, Collection.owner_id)
+                .outerjoin(Collection, Collection.id == PropertyTour.collection_id)
+                .where(PropertyTour.id == tour_id)
+            )).first()
+            if not tour_owner:
+                return None
+            if tour_owner.owner_id != user_id:
+                raise ValueError("Unauthorized to update this tour request")
+            raise ValueError(_INVALID_TOUR_STATUS_ERROR)
+
+        # Update the tour only if the user owns its collection - the ownership check
+        # and the write are one statement
         result = await db.execute(
-            select(PropertyTour).where(PropertyTour.id == tour_id)
-        )
-        tour = result.scalar_one_or_none()
-
-        if not tour:
-            return None
-
-        # Verify the user owns the collection
-        collection_result = await db.execute(
-            select(Collection).where(
-                and_(
-                    Collection.id == tour.collection_id,
-                    Collection.owner_id == user_id
+            update(PropertyTour)
+            .where(
+                PropertyTour.id == tour_id,
+                PropertyTour.collection_id.in_(
+                    select(Collection.id).where(Collection.owner_id == user_id)
                 )
             )
+            .values(status=status_update.status, updated_at=datetime.now(timezone.utc))
+            .returning(PropertyTour)
         )
-        collection = collection_result.scalar_one_or_none()
+        tour = result.scalar_one_or_none()
 
-        if not collection:
+        if not tour:
+            # Nothing updated - tell a missing tour apart from one the user doesn't own
+            tour_exists = await db.scalar(select(PropertyTour.id).where(PropertyTour.id == tour_id))
+            if not tour_exists:
+                return None
             raise ValueError("Unauthorized to update this tour request")
 
-        # Validate status
-        valid_statuses = ["PENDING", "CONFIRMED", "CANCELLED"]
-        if status_update.status not in valid_statuses:
-            raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
-
-        # Update status
-        tour.status = status_update.status
-        tour.updated_at = datetime.now()
-
         await db.commit()
-        await db.refresh(tour)
 
-        return PropertyTourResponse.from_orm(tour)
+        return PropertyTourResponse.model_validate(tour)
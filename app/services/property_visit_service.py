@@ -11,6 +11,8 @@ from app.config.logging import get_logger
 
 logger = get_logger(__name__)
 
+_COLLECTION_DESCRIPTION_TEMPLATE = "Properties similar to {} based on your preferences"
+
 
 class PropertyVisitService:
     
@@ -29,17 +31,22 @@ class PropertyVisitService:
             return None
 
         try:
-            # Get the original property to create smart filters
-            visited_property = await PropertyVisitService.get_property_by_id(db, form_data.property_id)
+            # Only the visited property's address is needed to name the collection
+            result = await db.execute(
+                select(Property.street_address).where(Property.id == form_data.property_id)
+            )
+            visited_property = result.first()
             
             if not visited_property:
                 return None
+
+            address = visited_property.street_address
             
             # Create collection directly
             collection = Collection(
                 owner_id=form_data.agent_id,  # Agent ID is required and validated above
-                name=visited_property.get('address', 'Unknown Property'),
-                description=f"Properties similar to {visited_property.get('address', 'the visited property')} based on your preferences",
+                name=address or "Unknown Property",
+                description=_COLLECTION_DESCRIPTION_TEMPLATE.format(address or "the visited property"),
                 visitor_email=form_data.email,
                 visitor_name=form_data.full_name,
                 visitor_phone=form_data.phone,
@@ -49,16 +56,21 @@ class PropertyVisitService:
                 updated_at=datetime.utcnow()
             )
             
+            # Flush instead of commit + refresh: the id is generated client-side, and the
+            # preferences commit persists the collection with them in one transaction
             db.add(collection)
-            await db.commit()
-            await db.refresh(collection)
+            await db.flush()
             
             # Auto-generate preferences based on the original property and form data
             try:
                 await CollectionPreferencesService.auto_generate_preferences(db, collection.id, form_data)
             except Exception as e:
-                # Collection creation should still succeed even if preferences fail
-                pass
+                # Collection creation should still succeed even if preferences fail -
+                # the rollback detaches the flushed collection, so insert it again
+                await db.rollback()
+                db.add(collection)
+
+            await db.commit()
 
             return collection.id
             
@@ -66,34 +78,3 @@ class PropertyVisitService:
             logger.error("creating collection from property visit failed", extra={"error": str(e)})
             await db.rollback()
             return None
-    
-    @staticmethod
-    async def get_property_by_id(db: AsyncSession, property_id: str) -> Optional[dict]:
-        """Get property details by ID from database"""
-        try:
-            stmt = select(Property).where(Property.id == property_id)
-            result = await db.execute(stmt)
-            property_record = result.scalar_one_or_none()
-            
-            if not property_record:
-                return None
-            
-            # Use structured database fields directly (zillow_data field was removed)
-            return {
-                "id": property_record.id,
-                "address": property_record.street_address,
-                "city": property_record.city,
-                "state": property_record.state,
-                "zipCode": property_record.zipcode,
-                "price": property_record.price,
-                "beds": property_record.bedrooms,
-                "baths": property_record.bathrooms,
-                "squareFeet": property_record.living_area,
-                "lotSize": property_record.lot_size,
-                "propertyType": property_record.home_type,
-                "description": "Beautiful property"  # Default description since zillow_data was removed
-            }
-            
-        except Exception as e:
-            logger.error("fetching property by ID failed", extra={"error": str(e)})
-            return None
\ No newline at end of file
@@ -1,37 +1,44 @@
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from typing import Optional
 
 from app.models.database import User
 from app.schemas.user import UserCreate
 from app.utils.auth import hash_password, verify_password
 
+# Built once at import; each call only binds the email parameter
+_STMT_BY_EMAIL = select(User).where(User.email == bindparam('email'))
+
 class UserService:
     @staticmethod
     async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
         """Create a new user"""
-        # Hash the password
-        hashed_password = hash_password(user_data.password)
+        # Hash the password (bcrypt is slow, so keep it off the event loop)
+        hashed_password = await asyncio.to_thread(hash_password, user_data.password)
         
-        # Create user object
-        db_user = User(
+        # Insert the user unless the email is taken - RETURNING loads every column
+        # (including server defaults), so no refresh is needed
+        stmt = sqlite_insert(User).values(
             email=user_data.email,
             hashed_password=hashed_password,
             first_name=user_data.first_name,
             last_name=user_data.last_name,
             state=user_data.state,
             brokerage=user_data.brokerage
-        )
-        
-        try:
-            db.add(db_user)
-            await db.commit()
-            await db.refresh(db_user)
-            return db_user
-        except IntegrityError:
+        ).on_conflict_do_nothing(
+            index_elements=['email']
+        ).returning(User)
+
+        db_user = (await db.execute(stmt)).scalar_one_or_none()
+
+        if not db_user:
             await db.rollback()
             raise ValueError("Email already exists")
+
+        await db.commit()
+        return db_user
     
     @staticmethod
     async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
@@ -41,7 +48,7 @@ class UserService:
         if not user:
             return None
             
-        if not verify_password(password, user.hashed_password):
+        if not await asyncio.to_thread(verify_password, password, user.hashed_password):
             return None
             
         return user
@@ -49,11 +56,10 @@ class UserService:
     @staticmethod
     async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
         """Get user by email"""
-        result = await db.execute(select(User).where(User.email == email))
+        result = await db.execute(_STMT_BY_EMAIL, {'email': email})
         return result.scalar_one_or_none()
     
     @staticmethod
     async def get_user_by_id(db: AsyncSession, user_id: str) -> Optional[User]:
-        """Get user by ID"""
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        """Get user by ID (served from the session's identity map when already loaded)"""
+        return await db.get(User, user_id)
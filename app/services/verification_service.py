@@ -1,7 +1,11 @@
-import random
-import string
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
+import asyncio
+import heapq
+import itertools
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
 from passlib.context import CryptContext
 from app.config.logging import get_logger
 
@@ -12,50 +16,116 @@ logger = get_logger(__name__)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+@dataclass(slots=True)
+class VerificationEntry:
+    """Pending email verification (expires_at and last_sent are integer epoch seconds)"""
+    code: str
+    expires_at: int
+    verified: bool
+    form_data: Dict[str, Any]
+    attempts: int
+    last_sent: int
+
+
 class VerificationService:
     def __init__(self):
-        # In-memory cache: {email: {code, expires_at, verified, form_data, attempts, last_sent}}
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # In-memory cache: {email: VerificationEntry}
+        # kept in least-recently-used order and capped at max_cache_entries
+        self._cache: "OrderedDict[str, VerificationEntry]" = OrderedDict()
+        self.max_cache_entries = 100_000
+        # Min-heap of (expires_at, version, email) so cleanup only visits expired entries.
+        # Entries are removed lazily: a heap item is stale once its version no longer
+        # matches the email's current version (code re-sent or verification cleared)
+        self._expiry_heap: List[Tuple[int, int, str]] = []
+        self._versions: Dict[str, int] = {}
+        self._version_counter = itertools.count()
         self.code_expiration_minutes = 15
         self.rate_limit_window_minutes = 15
         self.max_attempts_per_window = 3
 
+    def _track_expiry(self, email: str, expires_at: int) -> None:
+        """Record the current expiry of an email's entry in the expiry heap"""
+        version = next(self._version_counter)
+        self._versions[email] = version
+        heapq.heappush(self._expiry_heap, (expires_at, version, email))
+
+    def _get_entry(self, email: str) -> Optional[VerificationEntry]:
+        """Look up an email's entry and mark it as recently used"""
+        entry = self._cache.get(email)
+        if entry is not None:
+            self._cache.move_to_end(email)
+        return entry
+
+    def _evict_some(self, now: int, k: int = 8) -> int:
+        """
+        Pop at most k expired items from the expiry heap and drop their entries
+        Returns number of entries removed
+        """
+        removed = 0
+
+        while k > 0 and self._expiry_heap and self._expiry_heap[0][0] < now:
+            k -= 1
+            _, version, email = heapq.heappop(self._expiry_heap)
+            if self._versions.get(email) != version:
+                continue
+
+            del self._versions[email]
+            self._cache.pop(email, None)
+            removed += 1
+
+        return removed
+
     def generate_code(self) -> str:
         """Generate a random 6-digit verification code"""
-        return ''.join(random.choices(string.digits, k=6))
+        return f"{secrets.randbelow(1_000_000):06d}"
 
-    def store_code(self, email: str, code: str, form_data: Dict[str, Any]) -> None:
+    async def store_code(self, email: str, code: str, form_data: Dict[str, Any]) -> None:
         """
         Store verification code with form data in cache
         Form data should include: first_name, last_name, state, brokerage, password
+        The send is recorded before the first await, so a concurrent request for the same
+        email that passed can_send_code at the same time still counts against the rate limit
         """
-        # Hash password before storing
-        if 'password' in form_data:
-            form_data['password'] = pwd_context.hash(form_data['password'])
-
-        now = datetime.now(timezone.utc)
-        expires_at = now + timedelta(minutes=self.code_expiration_minutes)
+        now = int(time.time())
+        expires_at = now + self.code_expiration_minutes * 60
 
         # Check if entry exists to preserve attempts counter
-        existing = self._cache.get(email, {})
-        attempts = existing.get('attempts', 0) + 1
+        existing = self._cache.get(email)
+        attempts = existing.attempts + 1 if existing else 1
 
         # Check if this is within the same rate limit window
-        last_sent = existing.get('last_sent')
+        last_sent = existing.last_sent if existing else None
         if last_sent:
-            time_since_last = (now - last_sent).total_seconds() / 60
+            time_since_last = (now - last_sent) / 60
             if time_since_last >= self.rate_limit_window_minutes:
                 # Reset attempts if we're in a new window
                 attempts = 1
 
-        self._cache[email] = {
-            'code': code,
-            'expires_at': expires_at,
-            'verified': False,
-            'form_data': form_data,
-            'attempts': attempts,
-            'last_sent': now
-        }
+        # Form data is attached once the password is hashed below
+        entry = VerificationEntry(
+            code=code,
+            expires_at=expires_at,
+            verified=False,
+            form_data={},
+            attempts=attempts,
+            last_sent=now
+        )
+        self._cache[email] = entry
+        self._cache.move_to_end(email)
+        self._track_expiry(email, expires_at)
+
+        # Evict the least recently used entries once over capacity
+        while len(self._cache) > self.max_cache_entries:
+            evicted_email, _ = self._cache.popitem(last=False)
+            self._versions.pop(evicted_email, None)
+
+        # Reap a few expired entries per write so the cache stays bounded without a sweeper task
+        self._evict_some(now)
+
+        # Hash password before storing (bcrypt is slow, so keep it off the event loop)
+        if 'password' in form_data:
+            form_data['password'] = await asyncio.to_thread(pwd_context.hash, form_data['password'])
+        entry.form_data = form_data
 
         logger.info(f"Stored verification code for {email} (attempt {attempts})")
 
@@ -64,18 +134,18 @@ class VerificationService:
         Check if email can receive a new verification code
         Returns (can_send, error_message)
         """
-        entry = self._cache.get(email)
+        entry = self._get_entry(email)
 
         if not entry:
             return True, None
 
-        now = datetime.now(timezone.utc)
-        last_sent = entry.get('last_sent')
-        attempts = entry.get('attempts', 0)
+        now = int(time.time())
+        last_sent = entry.last_sent
+        attempts = entry.attempts
 
         # Check if we're in the same rate limit window
         if last_sent:
-            time_since_last = (now - last_sent).total_seconds() / 60
+            time_since_last = (now - last_sent) / 60
 
             if time_since_last < self.rate_limit_window_minutes:
                 # Still in the same window - check attempt count
@@ -89,50 +159,50 @@ class VerificationService:
         Verify the code for an email
         Returns (is_valid, error_message)
         """
-        entry = self._cache.get(email)
+        entry = self._get_entry(email)
 
         if not entry:
             return False, "No verification code found for this email"
 
         # Check if already verified
-        if entry.get('verified'):
+        if entry.verified:
             return False, "Email already verified"
 
         # Check if expired
-        now = datetime.now(timezone.utc)
-        if now > entry['expires_at']:
+        now = int(time.time())
+        if now > entry.expires_at:
             return False, "Verification code has expired. Please request a new one."
 
         # Check if code matches
-        if entry['code'] != code:
+        if entry.code != code:
             return False, "Invalid verification code"
 
         # Mark as verified
-        entry['verified'] = True
+        entry.verified = True
         logger.info(f"Email verified successfully: {email}")
 
         return True, None
 
     def is_verified(self, email: str) -> bool:
         """Check if email is verified"""
-        entry = self._cache.get(email)
+        entry = self._get_entry(email)
         if not entry:
             return False
-        return entry.get('verified', False)
+        return entry.verified
 
     def get_form_data(self, email: str) -> Optional[Dict[str, Any]]:
         """Retrieve stored form data for verified email"""
-        entry = self._cache.get(email)
-        if not entry or not entry.get('verified'):
+        entry = self._get_entry(email)
+        if not entry or not entry.verified:
             return None
-        return entry.get('form_data')
+        return entry.form_data
 
     def resend_code(self, email: str) -> tuple[bool, Optional[str], Optional[str]]:
         """
         Generate and store a new code for existing verification entry
         Returns (success, new_code, error_message)
         """
-        entry = self._cache.get(email)
+        entry = self._get_entry(email)
 
         if not entry:
             return False, None, "No verification pending for this email"
@@ -146,12 +216,14 @@ class VerificationService:
         new_code = self.generate_code()
 
         # Update entry with new code and expiration
-        now = datetime.now(timezone.utc)
-        entry['code'] = new_code
-        entry['expires_at'] = now + timedelta(minutes=self.code_expiration_minutes)
-        entry['verified'] = False
-        entry['attempts'] = entry.get('attempts', 0) + 1
-        entry['last_sent'] = now
+        now = int(time.time())
+        entry.code = new_code
+        entry.expires_at = now + self.code_expiration_minutes * 60
+        entry.verified = False
+        entry.attempts += 1
+        entry.last_sent = now
+        self._track_expiry(email, entry.expires_at)
+        self._evict_some(now)
 
         logger.info(f"Resent verification code for {email}")
 
@@ -159,6 +231,8 @@ class VerificationService:
 
     def clear_verification(self, email: str) -> None:
         """Clear verification data for an email (after successful signup)"""
+        # Any heap item left for this email becomes stale
+        self._versions.pop(email, None)
         if email in self._cache:
             del self._cache[email]
             logger.info(f"Cleared verification data for {email}")
@@ -168,20 +242,12 @@ class VerificationService:
         Remove expired verification entries from cache
         Returns number of entries removed
         """
-        now = datetime.now(timezone.utc)
-        expired_emails = []
-
-        for email, entry in self._cache.items():
-            if now > entry['expires_at']:
-                expired_emails.append(email)
-
-        for email in expired_emails:
-            del self._cache[email]
+        removed = self._evict_some(int(time.time()), k=len(self._expiry_heap))
 
-        if expired_emails:
-            logger.info(f"Cleaned up {len(expired_emails)} expired verification entries")
+        if removed:
+            logger.info(f"Cleaned up {removed} expired verification entries")
 
-        return len(expired_emails)
+        return removed
 
 
 # Global instance
@@ -1,6 +1,6 @@
 import httpx
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 import asyncio
 from fastapi import HTTPException
 
@@ -12,6 +12,33 @@ from app.config.logging import get_logger
 # Get logger from centralized config
 logger = get_logger(__name__)
 
+# Shared across all service instances so every Zillow call draws from one token bucket
+_zillow_rate_limiter = RateLimiter()
+
+# Likewise shared so every call reuses the pooled (HTTP/2) connection instead of a new TLS handshake
+_zillow_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_zillow_client() -> httpx.AsyncClient:
+    """Return the shared Zillow HTTP client, creating it on first use"""
+    global _zillow_client
+    if _zillow_client is None:
+        _zillow_client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+    return _zillow_client
+
+
+async def close_zillow_client() -> None:
+    """Close the shared Zillow HTTP client (called on application shutdown)"""
+    global _zillow_client
+    if _zillow_client is not None:
+        await _zillow_client.aclose()
+        _zillow_client = None
+
+
 class ZillowWorkingService:
     """
     Zillow service using zllw-working-api.p.rapidapi.com API.
@@ -21,7 +48,7 @@ class ZillowWorkingService:
     def __init__(self):
         self.api_key = os.getenv("RAPID_API_KEY")
         self.base_url = "https://zllw-working-api.p.rapidapi.com"
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = _zillow_rate_limiter
 
         if not self.api_key:
             logger.warning("RAPID_API_KEY not found in environment variables")
@@ -290,26 +317,26 @@ class ZillowWorkingService:
         url = f"{self.base_url}/search/byaddress"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                await self.rate_limiter.acquire_token()
-                response = await client.get(url, headers=headers, params=params)
+            client = _get_zillow_client()
+            await self.rate_limiter.acquire_token()
+            response = await client.get(url, headers=headers, params=params)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Zillow API error: {response.status_code}")
-                    logger.error(f"Response text: {response.text}")
-                    logger.error(f"Request URL: {url}")
-                    logger.error(f"Request params: {params}")
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Zillow API error: {response.status_code}")
+                logger.error(f"Response text: {response.text}")
+                logger.error(f"Request URL: {url}")
+                logger.error(f"Request params: {params}")
 
-                    try:
-                        error_json = response.json()
-                        logger.error(f"Response JSON: {error_json}")
-                    except:
-                        pass
+                try:
+                    error_json = response.json()
+                    logger.error(f"Response JSON: {error_json}")
+                except:
+                    pass
 
-                    # Return empty result for non-blocking behavior
-                    return {'searchResults': []}
+                # Return empty result for non-blocking behavior
+                return {'searchResults': []}
 
         except httpx.TimeoutException:
             logger.error("Zillow API request timed out")
@@ -385,26 +412,26 @@ class ZillowWorkingService:
         url = f"{self.base_url}/search/bycoordinates"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                await self.rate_limiter.acquire_token()
-                response = await client.get(url, headers=headers, params=params)
+            client = _get_zillow_client()
+            await self.rate_limiter.acquire_token()
+            response = await client.get(url, headers=headers, params=params)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Zillow API error: {response.status_code}")
-                    logger.error(f"Response text: {response.text}")
-                    logger.error(f"Request URL: {url}")
-                    logger.error(f"Request params: {params}")
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Zillow API error: {response.status_code}")
+                logger.error(f"Response text: {response.text}")
+                logger.error(f"Request URL: {url}")
+                logger.error(f"Request params: {params}")
 
-                    try:
-                        error_json = response.json()
-                        logger.error(f"Response JSON: {error_json}")
-                    except:
-                        pass
+                try:
+                    error_json = response.json()
+                    logger.error(f"Response JSON: {error_json}")
+                except:
+                    pass
 
-                    # Return empty result for non-blocking behavior
-                    return {'searchResults': []}
+                # Return empty result for non-blocking behavior
+                return {'searchResults': []}
 
         except httpx.TimeoutException:
             logger.error("Zillow API request timed out")
@@ -421,29 +448,41 @@ class ZillowWorkingService:
         Get matching properties based on preferences.
         Automatically chooses between coordinate or location-based search.
         """
+        properties = []
+        async for page in self.get_matching_properties_stream(preferences):
+            properties.extend(page)
+
+        logger.info(f"Found {len(properties)} properties")
+        return properties
 
+    async def get_matching_properties_stream(
+        self,
+        preferences: CollectionPreferencesSchema
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of matching properties as each Zillow request completes.
+        Coordinate searches yield a single page; location searches yield one page per batch.
+        """
         if preferences.lat and preferences.long:
             logger.info("Using coordinate-based search")
             zillow_response = await self.search_properties_by_coordinates(preferences)
+
+            # Parse results from searchResults array
+            properties = []
+            for result in zillow_response.get('searchResults', []):
+                parsed_property = self.parse_zillow_property(result)
+                if parsed_property:  # Only add if parsing succeeded
+                    properties.append(parsed_property)
+
+            yield properties
+
         # Use location search if cities or townships available
         elif preferences.cities or preferences.townships:
             logger.info("Using location-based batch search")
-            return await self.get_matching_properties_by_locations(preferences)
+            async for page in self.stream_matching_properties_by_locations(preferences):
+                yield page
         else:
             logger.warning("No coordinates or locations specified in preferences")
-            return []
-
-        # Parse results from searchResults array
-        search_results = zillow_response.get('searchResults', [])
-        properties = []
-
-        for result in search_results:
-            parsed_property = self.parse_zillow_property(result)
-            if parsed_property:  # Only add if parsing succeeded
-                properties.append(parsed_property)
-
-        logger.info(f"Found {len(properties)} properties")
-        return properties
 
     async def get_matching_properties_by_locations(
         self,
@@ -455,7 +494,21 @@ class ZillowWorkingService:
         Uses the new API's multi-location feature (up to 5 locations separated by semicolons).
         """
         all_properties = []
-        seen_zpids = set()  # Track zpids to avoid duplicates
+        async for page in self.stream_matching_properties_by_locations(preferences):
+            all_properties.extend(page)
+
+        logger.info(f"Total unique properties found across all locations: {len(all_properties)}")
+        return all_properties
+
+    async def stream_matching_properties_by_locations(
+        self,
+        preferences: CollectionPreferencesSchema
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield the unique properties found for each batch of up to 5 locations
+        as soon as that batch's Zillow request completes.
+        """
+        seen_zpids = set()  # Track zpids to avoid duplicates across batches
 
         # Combine cities and townships into single list
         locations = []
@@ -466,7 +519,7 @@ class ZillowWorkingService:
 
         if not locations:
             logger.info("No cities or townships specified for location search")
-            return []
+            return
 
         logger.info(f"Starting location search for {len(locations)} locations: {locations}")
 
@@ -480,6 +533,7 @@ class ZillowWorkingService:
 
             logger.info(f"Searching batch: {location_string}")
 
+            batch_properties = []
             try:
                 # First attempt
                 try:
@@ -501,7 +555,6 @@ class ZillowWorkingService:
                 search_results = zillow_response.get('searchResults', [])
                 logger.info(f"Batch returned {len(search_results)} results")
 
-                batch_property_count = 0
                 for result in search_results:
                     # Parse the property
                     parsed_property = self.parse_zillow_property(result)
@@ -512,22 +565,19 @@ class ZillowWorkingService:
                     # Check for duplicates
                     zpid = parsed_property.get('zpid')
                     if zpid and zpid not in seen_zpids:
-                        all_properties.append(parsed_property)
+                        batch_properties.append(parsed_property)
                         seen_zpids.add(zpid)
-                        batch_property_count += 1
 
-                logger.info(f"Added {batch_property_count} unique properties from batch")
-
-                # Rate limiting between batches (1 second delay)
-                if batch_start + batch_size < len(locations):  # Not the last batch
-                    await asyncio.sleep(1)
+                logger.info(f"Added {len(batch_properties)} unique properties from batch")
 
             except Exception as e:
                 logger.error(f"Unexpected error processing batch {batch_locations}", exc_info=True)
                 continue  # Continue with next batch
 
-        logger.info(f"Total unique properties found across all locations: {len(all_properties)}")
-        return all_properties
+            # No fixed pause between batches: each search draws from the shared
+            # token bucket, which only waits when the request rate would be exceeded
+            if batch_properties:
+                yield batch_properties
 
     async def get_property_by_address(self, address: str, details: bool = False):
         """
@@ -549,39 +599,39 @@ class ZillowWorkingService:
         url = f"{self.base_url}/pro/byaddress?propertyaddress={encoded_address}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                await self.rate_limiter.acquire_token()
-                response = await client.get(url, headers=headers)
-
-                if response.status_code == 200:
-                    data = response.json()
-
-                    # Transform new API response to match old API structure
-                    transformed_data = self._transform_property_details(data, details)
-
-                    if not details:
-                        return PropertyDetailResponse(**transformed_data)
-                    else:
-                        return ZillowPropertyDetailResponse(**transformed_data)
-
-                elif response.status_code == 401:
-                    raise HTTPException(status_code=401, detail="Invalid RapidAPI key")
-                elif response.status_code == 404:
-                    raise HTTPException(status_code=404, detail="Property not found")
-                elif response.status_code == 429:
-                    raise HTTPException(status_code=429, detail="Rate limit exceeded")
+            client = _get_zillow_client()
+            await self.rate_limiter.acquire_token()
+            response = await client.get(url, headers=headers)
+
+            if response.status_code == 200:
+                data = response.json()
+
+                # Transform new API response to match old API structure
+                transformed_data = self._transform_property_details(data, details)
+
+                if not details:
+                    return PropertyDetailResponse(**transformed_data)
                 else:
-                    logger.error(f"Zillow API error for address {address}: {response.status_code}")
-                    logger.error(f"Response text: {response.text}")
-                    logger.error(f"Request URL: {url}")
+                    return ZillowPropertyDetailResponse(**transformed_data)
+
+            elif response.status_code == 401:
+                raise HTTPException(status_code=401, detail="Invalid RapidAPI key")
+            elif response.status_code == 404:
+                raise HTTPException(status_code=404, detail="Property not found")
+            elif response.status_code == 429:
+                raise HTTPException(status_code=429, detail="Rate limit exceeded")
+            else:
+                logger.error(f"Zillow API error for address {address}: {response.status_code}")
+                logger.error(f"Response text: {response.text}")
+                logger.error(f"Request URL: {url}")
 
-                    try:
-                        error_json = response.json()
-                        logger.error(f"Response JSON: {error_json}")
-                    except:
-                        pass
+                try:
+                    error_json = response.json()
+                    logger.error(f"Response JSON: {error_json}")
+                except:
+                    pass
 
-                    raise HTTPException(status_code=response.status_code, detail=f"External API error: {response.text}")
+                raise HTTPException(status_code=response.status_code, detail=f"External API error: {response.text}")
 
         except httpx.TimeoutException:
             raise HTTPException(status_code=504, detail="Request to external API timed out")
@@ -8,6 +8,9 @@ import os
 
 logger = get_logger(__name__)
 
+# Cached property details older than this are served stale while being refreshed in the background
+CACHE_FRESH_HOURS = int(os.getenv("CACHE_FRESH_HOURS", 24))
+
 async def cleanup_expired_property_cache():
     """Remove expired property cache data older than 7 days"""
     cache_expiry_days = int(os.getenv("CACHE_EXPIRY_DAYS", 7))
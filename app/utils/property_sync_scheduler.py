@@ -13,7 +13,8 @@ server_dir = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(server_dir))
 
 from app.database import AsyncSessionLocal
-from app.services.property_sync_service import PropertySyncService
+from app.services.property_sync_service import get_property_sync_service
+from app.services.email_service import flush_emails
 from app.config.logging import get_logger
 
 logger = get_logger(__name__)
@@ -37,8 +38,8 @@ async def sync_all_collections_with_rate_limit() -> Dict[str, Any]:
     }
 
     try:
-        # Use existing PropertySyncService
-        property_sync_service = PropertySyncService()
+        # Use the shared PropertySyncService
+        property_sync_service = get_property_sync_service()
 
         async with AsyncSessionLocal() as db:
             # 1. Calculate dynamic batch size
@@ -78,30 +79,36 @@ async def sync_all_collections_with_rate_limit() -> Dict[str, Any]:
             )
             sync_results['collections_found'] = len(collections_with_preferences)
 
-            # Process each collection
             for i, (collection, preferences) in enumerate(collections_with_preferences, 1):
-                try:
-                    logger.info(
-                        f"Syncing collection {i}/{len(collections_with_preferences)}",
-                        extra={
-                            "collection_id": collection.id,
-                            "collection_name": collection.name,
-                            "last_synced_at": collection.last_synced_at.isoformat() if collection.last_synced_at else "Never"
-                        }
-                    )
-
-                    # Sync collection (this also updates last_synced_at)
-                    sync_result = await property_sync_service.sync_collection_properties(
-                        db, collection, preferences
-                    )
-
-                    sync_results['total_new_properties'] += sync_result['new_properties_count']
-                    sync_results['collections_processed'] += 1
-
-                except Exception as e:
-                    error_msg = f"Failed to sync collection {collection.name}: {str(e)}"
-                    logger.error("Collection sync failed", extra={"collection_name": collection.name, "error": str(e)})
-                    sync_results['errors'].append(error_msg)
+                logger.info(
+                    f"Syncing collection {i}/{len(collections_with_preferences)}",
+                    extra={
+                        "collection_id": collection.id,
+                        "collection_name": collection.name,
+                        "last_synced_at": collection.last_synced_at.isoformat() if collection.last_synced_at else "Never"
+                    }
+                )
+
+            collection_names = {collection.id: collection.name for collection, _ in collections_with_preferences}
+
+        # Sync the batch concurrently - each collection gets its own session
+        # (this also updates last_synced_at and sends the update digest)
+        results = await property_sync_service.sync_collections_concurrently(list(collection_names))
+
+        for (collection_id, collection_name), result in zip(collection_names.items(), results):
+            # gather() also returns a CancelledError raised by one collection's sync
+            if isinstance(result, BaseException):
+                error = str(result) or type(result).__name__
+                error_msg = f"Failed to sync collection {collection_name}: {error}"
+                logger.error("Collection sync failed", extra={"collection_name": collection_name, "error": error})
+                sync_results['errors'].append(error_msg)
+                continue
+
+            sync_results['total_new_properties'] += result['new_properties_count']
+            sync_results['collections_processed'] += 1
+
+        # Wait for the digest emails sent in the background during the sync
+        await flush_emails()
 
         sync_results['completed_at'] = datetime.now(timezone.utc)
         sync_results['duration_seconds'] = (
@@ -0,0 +1,23 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@asynccontextmanager
+async def count_queries(db: AsyncSession) -> AsyncIterator[List[str]]:
+    """
+    Collect the SQL statements sent on the session's connection while the block runs
+    (an executemany counts once)
+    """
+    statements: List[str] = []
+    connection = (await db.connection()).sync_connection
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", record_statement)